@@ -0,0 +1,213 @@
+import os
+import sys
+import json
+import time
+import random
+import argparse
+import platform
+import subprocess
+import tracemalloc
+import contextlib
+import numpy as np
+from genetic_algorithm import GeneticAlgorithm, FitnessEvaluator
+from genetic_algorithm.tictactoe.board import Board
+from model import MultilayerPerceptron, Minimax
+
+# Benchmarks dos caminhos críticos do treinamento.
+# Uso: python benchmark.py [--quick] [--output output/benchmark.json]
+#
+# Cada resultado traz vazão (moves/s, games/s, evals/s...), latência p50/p99 por chamada
+# e pico de memória alocada (tracemalloc, medido numa passada separada para não distorcer os tempos).
+# O JSON gerado pode ser comparado entre commits.
+
+PIPELINES = {
+    "hard": 8 * ['hard'],
+    "medium": 13 * ['medium'],
+    "main": 5 * ['medium'] + 8 * ['hard'],
+}
+TOPOLOGIES = [[9, 9, 9], [9, 32, 9], [9, 32, 18, 9], [9, 128, 9]]
+
+
+def _random_boards(n: int, rng: random.Random, o_to_move: bool = True) -> list[list[int]]:
+    """
+    Gera tabuleiros alcançáveis em andamento (com O da vez, se o_to_move).
+    """
+    boards = []
+    while len(boards) < n:
+        board = Board()
+        moves = rng.sample(range(9), 9)
+        n_moves = rng.randrange(1, 9, 2) if o_to_move else rng.randrange(0, 9)
+        for i, move in enumerate(moves[:n_moves]):
+            board.update_board(1 if i % 2 == 0 else -1, move)
+            if not board.is_ongoing():
+                break
+        if board.is_ongoing():
+            boards.append(list(board.board))
+    return boards
+
+
+def _measure(name: str, params: dict, calls, units: dict[str, float], warmup: int = 1, memory_calls: int = 100) -> dict:
+    """
+    Executa cada função de calls, medindo latência individual e, depois, o pico de memória.
+
+    As latências são medidas com o tracemalloc desligado (ele torna cada alocação ~3x mais lenta);
+    o pico de memória vem de uma segunda passada, com rastreamento, sobre as primeiras memory_calls chamadas.
+
+    units mapeia o nome da vazão (ex.: 'moves/s') para a quantidade de unidades por chamada.
+    """
+    latencies = np.empty(len(calls))
+    with open(os.devnull, 'w') as devnull, contextlib.redirect_stdout(devnull):
+        for call in calls[:warmup]:
+            call()
+
+        for i, call in enumerate(calls):
+            start = time.perf_counter()
+            call()
+            latencies[i] = time.perf_counter() - start
+
+        tracemalloc.start()
+        for call in calls[:memory_calls]:
+            call()
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+    total = latencies.sum()
+    result = {
+        "name": name,
+        "params": params,
+        "calls": len(calls),
+        "total_s": total,
+        "throughput": {unit: per_call * len(calls) / total for unit, per_call in units.items()},
+        "p50_ms": float(np.percentile(latencies, 50) * 1e3),
+        "p99_ms": float(np.percentile(latencies, 99) * 1e3),
+        "peak_memory_bytes": peak,
+    }
+    print(f"Benchmark : {name} {params} : {', '.join(f'{v:,.1f} {k}' for k, v in result['throughput'].items())}"
+          f" : p50={result['p50_ms']:.4f}ms p99={result['p99_ms']:.4f}ms : peak={peak / 1024:.0f}KiB")
+    return result
+
+
+def bench_minimax(n: int, rng: random.Random) -> list[dict]:
+    results = []
+    boards = _random_boards(n, rng)
+    for solved in (True, False):
+        for mode in ('easy', 'medium', 'hard'):
+            minimax = Minimax(solved=solved)
+            minimax.update(mode)
+            calls = [lambda b=b: minimax.predict(b) for b in boards]
+            results.append(_measure("minimax.predict", {"mode": mode, "solved": solved}, calls, {"moves/s": 1}))
+    return results
+
+
+def bench_board(n: int, rng: random.Random) -> list[dict]:
+    boards = []
+    for cells in _random_boards(n, rng, o_to_move=False):
+        board = Board()
+        for i, v in enumerate(cells):
+            if v:
+                board.update_board(v, i)
+        boards.append(board)
+    calls = [board.check_win for board in boards]
+    return [_measure("board.check_win", {}, calls, {"checks/s": 1})]
+
+
+def bench_mlp(n: int, rng: random.Random) -> list[dict]:
+    results = []
+    boards = _random_boards(n, rng, o_to_move=False)
+    for topology in TOPOLOGIES:
+        for dtype in (np.float64, np.float32):
+            mlp = MultilayerPerceptron(topology, dtype=dtype)
+            mlp.update(np.random.default_rng(0).uniform(-1, 1, mlp.count_weights()))
+            calls = [lambda b=b: mlp.predict(b) for b in boards]
+            results.append(_measure("mlp.predict", {"topology": topology, "dtype": np.dtype(dtype).name}, calls, {"moves/s": 1}))
+    return results
+
+
+def _games_played(evaluator: FitnessEvaluator) -> int:
+    """
+    Partidas efetivamente jogadas por avaliação: modos determinísticos são jogados uma única vez.
+    """
+    return sum(1 if deterministic else count for _, count, deterministic in evaluator._schedule)
+
+
+def bench_fitness(n: int) -> list[dict]:
+    results = []
+    rng = np.random.default_rng(0)
+    mlp = MultilayerPerceptron([9, 32, 9])
+    for name, pipeline in PIPELINES.items():
+        evaluator = FitnessEvaluator(mlp, Minimax(), pipeline)
+        games = _games_played(evaluator)
+        chromosomes = rng.uniform(-1, 1, (n, mlp.count_weights()))
+        calls = [lambda c=c: evaluator._evaluate_fitness(c) for c in chromosomes]
+        results.append(_measure("fitness.evaluate", {"pipeline": name, "path": "serial"}, calls,
+                                {"evals/s": 1, "games/s": games}))
+
+        population = rng.uniform(-1, 1, (n, mlp.count_weights()))
+        calls = [lambda: evaluator.evaluate_population(population)] * 5
+        results.append(_measure("fitness.evaluate", {"pipeline": name, "path": "batched", "population": n}, calls,
+                                {"evals/s": n, "games/s": n * games}))
+    return results
+
+
+def bench_generation(pop_sizes: list[int], worker_counts: list[int], generations: int) -> list[dict]:
+    results = []
+    mlp = MultilayerPerceptron([9, 32, 9])
+    evaluator = FitnessEvaluator(mlp, Minimax(), PIPELINES["main"])
+    for pop_size in pop_sizes:
+        configs = [("batched", {"batched": True})]
+        configs += [(f"workers={n}", {"optimized": n > 1, "n_workers": n}) for n in worker_counts]
+        configs += [(f"thread={n}", {"backend": "thread", "n_workers": n}) for n in worker_counts if n > 1]
+        for label, kwargs in configs:
+            ga = GeneticAlgorithm(pop_size, mlp.count_weights(), evaluator, seed=0, cache_fitness=False, **kwargs)
+            with ga._open_pool() as pool:
+                def generation():
+                    ga._evaluate_population(pool)
+                    elites, _ = ga._elitism_list()
+                    ga._population = ga._reproduce(elites)
+                calls = [generation] * generations
+                results.append(_measure("ga.generation", {"population": pop_size, "evaluation": label}, calls,
+                                        {"generations/s": 1, "evals/s": pop_size}))
+    return results
+
+
+def _commit() -> str | None:
+    try:
+        return subprocess.check_output(['git', 'rev-parse', 'HEAD'], text=True, stderr=subprocess.DEVNULL).strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="Benchmarks dos caminhos críticos do treinamento.")
+    parser.add_argument('--output', default='output/benchmark.json', help="Arquivo JSON de saída.")
+    parser.add_argument('--quick', action='store_true', help="Tamanhos reduzidos, para checagens rápidas.")
+    args = parser.parse_args()
+
+    scale = 0.1 if args.quick else 1.0
+    rng = random.Random(0)
+    cpus = os.cpu_count() or 1
+
+    results = []
+    results += bench_minimax(int(2000 * scale), rng)
+    results += bench_board(int(20000 * scale), rng)
+    results += bench_mlp(int(5000 * scale), rng)
+    results += bench_fitness(int(500 * scale))
+    results += bench_generation(
+        pop_sizes=[100, 1000] if not args.quick else [50],
+        worker_counts=sorted({1, min(2, cpus), cpus}),
+        generations=3 if not args.quick else 2
+    )
+
+    report = {
+        "commit": _commit(),
+        "timestamp": time.strftime('%Y-%m-%dT%H:%M:%S'),
+        "python": sys.version.split()[0],
+        "numpy": np.__version__,
+        "platform": platform.platform(),
+        "cpu_count": cpus,
+        "results": results,
+    }
+    os.makedirs(os.path.dirname(args.output) or '.', exist_ok=True)
+    with open(args.output, 'w') as f:
+        json.dump(report, f, indent=2)
+    print(f"Benchmark : Resultados gravados em {args.output}")
@@ -0,0 +1,30 @@
+import os
+import sys
+from model import MultilayerPerceptron, PolicyTable
+
+# Converte modelos JSON (output/model_*.json) para o formato binário (.bin) carregado via memmap.
+# Uso: python convert_models.py [--policy] [arquivo.json ...]   (padrão: todos os .json em output/)
+#
+# Com --policy, também compila cada modelo numa tabela de política (.policy) e a confere contra a rede.
+
+if __name__ == '__main__':
+    args = sys.argv[1:]
+    policy = '--policy' in args
+    paths = [arg for arg in args if arg != '--policy'] or sorted(
+        os.path.join('output', name) for name in os.listdir('output') if name.endswith('.json')
+    )
+
+    for json_path in paths:
+        binary_path = os.path.splitext(json_path)[0] + '.bin'
+        MultilayerPerceptron.convert_json_to_binary(json_path, binary_path)
+        print(f"Convert : {json_path} ({os.path.getsize(json_path)} B) -> {binary_path} ({os.path.getsize(binary_path)} B)")
+
+        if policy:
+            policy_path = os.path.splitext(json_path)[0] + '.policy'
+            model = MultilayerPerceptron.from_binary(binary_path)
+            table = PolicyTable.from_model(model)
+            mismatches = table.verify(model)
+            if mismatches:
+                raise ValueError(f"Convert : {policy_path} diverge da rede em {len(mismatches)} posições")
+            table.save(policy_path)
+            print(f"Convert : {json_path} -> {policy_path} ({len(table)} posições, verificada)")
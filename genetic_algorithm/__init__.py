@@ -1,4 +1,7 @@
 from .fitness_evaluator import FitnessEvaluator
 from .genetic_algorithm import GeneticAlgorithm
+from .island_model import IslandModel
+from .steady_state import SteadyStateGA
+from .distributed import DistributedCoordinator
 
-__all__ = ["FitnessEvaluator, GeneticAlgorithm"]
\ No newline at end of file
+__all__ = ["FitnessEvaluator, GeneticAlgorithm, IslandModel, SteadyStateGA, DistributedCoordinator"]
\ No newline at end of file
@@ -0,0 +1,139 @@
+import time
+import numpy as np
+from multiprocessing import Pool, shared_memory
+
+# Estado de cada processo trabalhador, preenchido uma única vez pelo initializer.
+_worker = {}
+
+
+def _init_functions(fitness_functions: tuple) -> None:
+    _worker['fitness_functions'] = fitness_functions
+
+
+def _init_worker(fitness_functions, population_name: str, results_name: str, shape: tuple[int, int], dtype: str) -> None:
+    # Os segmentos são criados e removidos pelo processo principal; o trabalhador só se anexa.
+    population_shm = shared_memory.SharedMemory(name=population_name)
+    results_shm = shared_memory.SharedMemory(name=results_name)
+    _init_functions(fitness_functions)
+    _worker['shm'] = (population_shm, results_shm)
+    _worker['population'] = np.ndarray(shape, dtype=dtype, buffer=population_shm.buf)
+    _worker['results'] = np.ndarray(shape[0], dtype=float, buffer=results_shm.buf)
+
+
+def _evaluate_range(task: tuple[int, int, int, float | None]) -> int:
+    start, stop, function_index, cutoff = task
+    fitness_function = _worker['fitness_functions'][function_index]
+    population = _worker['population']
+    results = _worker['results']
+    aborted = getattr(fitness_function, 'aborted', 0)
+    for i in range(start, stop):
+        if cutoff is None:
+            results[i] = fitness_function(population[i])
+        else:
+            results[i] = fitness_function(population[i], cutoff)
+    return getattr(fitness_function, 'aborted', 0) - aborted  # Avaliações interrompidas pelo cutoff
+
+
+class SharedPopulationPool:
+    """
+    Pool de processos persistente com a população em memória compartilhada.
+
+    A fitness_function é enviada uma única vez para cada trabalhador (no initializer).
+    A cada avaliação, a população é copiada para um array compartilhado (pop, n_genes),
+    os trabalhadores recebem apenas intervalos de índices e escrevem a aptidão direto
+    num array compartilhado de resultados.
+
+    Parâmetros:
+    -----------
+    fitness_function : function
+        Função de aptidão que recebe um cromossomo (np.ndarray) e retorna um float.
+    shape : tuple[int, int]
+        Formato máximo da população (pop_size, chromosome_size).
+    processes : int, opcional
+        Número de processos. Por padrão, os.cpu_count().
+    chunk_size : int, opcional
+        Cromossomos por tarefa. Por padrão, divide a população em ~4 tarefas por processo.
+    extra_functions : tuple, opcional
+        Funções de aptidão adicionais (ex.: triagem), selecionadas em evaluate() por function_index >= 1.
+    dtype : default=np.float64
+        Tipo dos genes no segmento compartilhado (np.float32 reduz pela metade a memória e as cópias).
+
+    Atributos:
+    ----------
+    ipc_seconds : float
+        Tempo acumulado copiando a população e os resultados de/para a memória compartilhada.
+    aborted : int
+        Avaliações interrompidas pelo cutoff, somadas de todos os trabalhadores.
+    """
+
+    name = 'process'
+    supports_cutoff = True
+
+    def __init__(self, fitness_function, shape: tuple[int, int], processes: int | None = None, chunk_size: int | None = None,
+                 extra_functions: tuple = (), dtype=np.float64):
+        self._fitness_functions = (fitness_function, *extra_functions)
+        self._shape = tuple(shape)
+        self._dtype = np.dtype(dtype)
+        self._processes = processes
+        self._chunk_size = chunk_size
+        self._pool = None
+        self._population_shm = None
+        self._results_shm = None
+        self.ipc_seconds = 0.0
+        self.aborted = 0
+
+    def __enter__(self) -> 'SharedPopulationPool':
+        self.open()
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def open(self) -> None:
+        pop_size, chromosome_size = self._shape
+        self._population_shm = shared_memory.SharedMemory(create=True, size=pop_size * chromosome_size * self._dtype.itemsize)
+        self._results_shm = shared_memory.SharedMemory(create=True, size=pop_size * np.dtype(float).itemsize)
+        self._population = np.ndarray(self._shape, dtype=self._dtype, buffer=self._population_shm.buf)
+        self._results = np.ndarray(pop_size, dtype=float, buffer=self._results_shm.buf)
+
+        self._pool = Pool(
+            processes=self._processes,
+            initializer=_init_worker,
+            initargs=(self._fitness_functions, self._population_shm.name, self._results_shm.name, self._shape, self._dtype.str)
+        )
+        self._processes = self._pool._processes
+
+    def close(self) -> None:
+        if self._pool is not None:
+            self._pool.close()
+            self._pool.join()
+            self._pool = None
+        for shm in (self._population_shm, self._results_shm):
+            if shm is not None:
+                shm.close()
+                shm.unlink()
+        self._population_shm = self._results_shm = None
+        self._population = self._results = None
+
+    def _tasks(self, n: int, function_index: int, cutoff: float | None) -> list[tuple[int, int, int, float | None]]:
+        chunk_size = self._chunk_size or max(1, -(-n // (4 * self._processes)))
+        return [(start, min(start + chunk_size, n), function_index, cutoff) for start in range(0, n, chunk_size)]
+
+    def evaluate(self, population, function_index: int = 0, cutoff: float | None = None) -> np.ndarray:
+        """
+        Avalia a população (n <= pop_size cromossomos) e retorna a aptidão de cada um.
+
+        function_index 0 usa a fitness_function; valores maiores usam extra_functions.
+        Se cutoff for dado, é repassado à função (fitness_function(chromosome, cutoff)).
+        """
+        n = len(population)
+        start = time.perf_counter()
+        self._population[:n] = population
+        self.ipc_seconds += time.perf_counter() - start
+
+        self.aborted += sum(self._pool.map(_evaluate_range, self._tasks(n, function_index, cutoff), chunksize=1))
+
+        start = time.perf_counter()
+        results = self._results[:n].copy()
+        self.ipc_seconds += time.perf_counter() - start
+        return results
@@ -0,0 +1,224 @@
+import os
+import copy
+import time
+import itertools
+import threading
+import numpy as np
+from concurrent.futures import Executor, ThreadPoolExecutor
+
+from ._shared_pool import SharedPopulationPool
+
+# Backends de avaliação da população. Todos têm a mesma interface do SharedPopulationPool:
+# gerenciador de contexto (open/close), evaluate(population, function_index=0, cutoff=None),
+# ipc_seconds, aborted (avaliações interrompidas pelo cutoff) e supports_cutoff.
+BACKENDS = ('serial', 'batched', 'thread', 'process', 'auto')
+
+
+def _call(fitness_function, chromosome: np.ndarray, cutoff: float | None) -> float:
+    return fitness_function(chromosome) if cutoff is None else fitness_function(chromosome, cutoff)
+
+
+def _aborted(fitness_function) -> int:
+    return getattr(fitness_function, 'aborted', 0)
+
+
+def _evaluate_chunk(fitness_function, population: np.ndarray, cutoff: float | None) -> tuple[np.ndarray, int]:
+    """
+    Avalia um bloco de cromossomos (executado no executor; precisa ser serializável).
+    Retorna as aptidões e quantas avaliações a função interrompeu pelo cutoff.
+    """
+    aborted = _aborted(fitness_function)
+    scores = np.array([_call(fitness_function, chromosome, cutoff) for chromosome in population], dtype=float)
+    return scores, _aborted(fitness_function) - aborted
+
+
+# Cópias das funções de aptidão por thread do executor, por backend (chave) e índice da função.
+_thread_copies = threading.local()
+_backend_keys = itertools.count()
+
+
+def _evaluate_chunk_copy(key: tuple[int, int], fitness_function, population: np.ndarray, cutoff: float | None) -> tuple[np.ndarray, int]:
+    """
+    Como _evaluate_chunk, mas com uma cópia da função própria da thread que executa a tarefa (criada na
+    primeira tarefa): threads de um mesmo executor não podem compartilhar o learner do FitnessEvaluator.
+    """
+    copies = _thread_copies.__dict__.setdefault('copies', {})
+    if key not in copies:
+        copies[key] = copy.deepcopy(fitness_function)
+    return _evaluate_chunk(copies[key], population, cutoff)
+
+
+def _chunks(n: int, workers: int, chunk_size: int | None) -> list[slice]:
+    chunk_size = chunk_size or max(1, -(-n // (4 * workers)))
+    return [slice(start, min(start + chunk_size, n)) for start in range(0, n, chunk_size)]
+
+
+class _Backend:
+    """
+    Base dos backends: gerenciador de contexto, contadores (ipc_seconds, aborted) e coleta de blocos.
+    """
+    supports_cutoff = True
+
+    def __init__(self, fitness_functions: tuple):
+        self._fitness_functions = fitness_functions
+        self.ipc_seconds = 0.0
+        self.aborted = 0
+
+    def __enter__(self):
+        self.open()
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def open(self) -> None:
+        pass
+
+    def close(self) -> None:
+        pass
+
+    def _gather(self, futures: list) -> np.ndarray:
+        """
+        Junta as aptidões dos blocos, na ordem de envio, e soma as avaliações interrompidas.
+        """
+        results = [future.result() for future in futures]
+        self.aborted += sum(aborted for _, aborted in results)
+        return np.concatenate([scores for scores, _ in results]) if results else np.empty(0)
+
+
+class SerialBackend(_Backend):
+    """
+    Avaliação sequencial no próprio processo, um cromossomo por vez.
+    """
+    name = 'serial'
+
+    def evaluate(self, population: np.ndarray, function_index: int = 0, cutoff: float | None = None) -> np.ndarray:
+        scores, aborted = _evaluate_chunk(self._fitness_functions[function_index], population, cutoff)
+        self.aborted += aborted
+        return scores
+
+
+class BatchedBackend(SerialBackend):
+    """
+    Avaliação da população inteira de uma vez via fitness_function.evaluate_population (simulador vetorizado).
+    O cutoff é ignorado: todas as partidas avançam juntas.
+    """
+    name = 'batched'
+    supports_cutoff = False
+
+    def evaluate(self, population: np.ndarray, function_index: int = 0, cutoff: float | None = None) -> np.ndarray:
+        return np.asarray(self._fitness_functions[function_index].evaluate_population(population), dtype=float)
+
+
+class ThreadBackend(SerialBackend):
+    """
+    Pool de threads. Cada thread trabalha com sua própria cópia das funções de aptidão (o FitnessEvaluator
+    altera o learner a cada avaliação). Se a função tiver evaluate_population, cada bloco é avaliado em lote,
+    e as operações NumPy liberam o GIL; caso contrário, os cromossomos do bloco são avaliados um a um.
+    """
+    name = 'thread'
+
+    def __init__(self, fitness_functions: tuple, workers: int | None = None, chunk_size: int | None = None):
+        super().__init__(fitness_functions)
+        self._workers = workers or os.cpu_count() or 1
+        self._chunk_size = chunk_size
+        self._executor = None
+        self._local = threading.local()
+        # Com evaluate_population os blocos são avaliados em lote, que não repassa o cutoff
+        self.supports_cutoff = not hasattr(fitness_functions[0], 'evaluate_population')
+
+    def open(self) -> None:
+        self._executor = ThreadPoolExecutor(max_workers=self._workers)
+
+    def close(self) -> None:
+        if self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
+
+    def _evaluate_local(self, population: np.ndarray, function_index: int, cutoff: float | None) -> tuple[np.ndarray, int]:
+        if not hasattr(self._local, 'fitness_functions'):
+            self._local.fitness_functions = copy.deepcopy(self._fitness_functions)
+        fitness_function = self._local.fitness_functions[function_index]
+        if hasattr(fitness_function, 'evaluate_population'):
+            return np.asarray(fitness_function.evaluate_population(population), dtype=float), 0
+        return _evaluate_chunk(fitness_function, population, cutoff)
+
+    def evaluate(self, population: np.ndarray, function_index: int = 0, cutoff: float | None = None) -> np.ndarray:
+        chunks = _chunks(len(population), self._workers, self._chunk_size)
+        futures = [self._executor.submit(self._evaluate_local, population[chunk], function_index, cutoff) for chunk in chunks]
+        return self._gather(futures)
+
+
+class ExecutorBackend(_Backend):
+    """
+    Executor externo compatível com concurrent.futures (ex.: ProcessPoolExecutor, ThreadPoolExecutor,
+    executores de clusters). Cada tarefa leva a função de aptidão e um bloco da população; cada thread
+    trabalhadora avalia com a sua própria cópia da função (criada na primeira tarefa), então executores
+    de threads também são seguros. O executor não é encerrado em close(), pois pertence a quem o criou.
+    """
+    name = 'executor'
+
+    def __init__(self, fitness_functions: tuple, executor: Executor, workers: int | None = None, chunk_size: int | None = None):
+        super().__init__(fitness_functions)
+        self._executor = executor
+        self._workers = workers or getattr(executor, '_max_workers', None) or os.cpu_count() or 1
+        self._chunk_size = chunk_size
+        self._key = next(_backend_keys)
+
+    def evaluate(self, population: np.ndarray, function_index: int = 0, cutoff: float | None = None) -> np.ndarray:
+        fitness_function = self._fitness_functions[function_index]
+        key = (self._key, function_index)
+        chunks = _chunks(len(population), self._workers, self._chunk_size)
+        futures = [self._executor.submit(_evaluate_chunk_copy, key, fitness_function, population[chunk], cutoff) for chunk in chunks]
+        return self._gather(futures)
+
+
+def create_backend(backend, fitness_functions: tuple, shape: tuple[int, int], workers: int | None = None,
+                   chunk_size: int | None = None, dtype=np.float64):
+    """
+    Cria o backend pelo nome ('serial', 'batched', 'thread', 'process') ou a partir de um Executor.
+    Um objeto que já implementa a interface de backend (ex.: DistributedCoordinator) é usado como está.
+    """
+    if hasattr(backend, 'evaluate') and hasattr(backend, 'supports_cutoff'):
+        return backend
+    if isinstance(backend, Executor):
+        return ExecutorBackend(fitness_functions, backend, workers, chunk_size)
+    if backend == 'serial':
+        return SerialBackend(fitness_functions)
+    if backend == 'batched':
+        return BatchedBackend(fitness_functions)
+    if backend == 'thread':
+        return ThreadBackend(fitness_functions, workers, chunk_size)
+    if backend == 'process':
+        return SharedPopulationPool(fitness_functions[0], shape, workers, chunk_size, extra_functions=fitness_functions[1:], dtype=dtype)
+    raise ValueError(f"Backend : Desconhecido: {backend!r} (esperado um Executor ou um de {BACKENDS})")
+
+
+def calibrate(fitness_functions: tuple, population: np.ndarray, workers: int | None = None,
+              chunk_size: int | None = None, sample_size: int | None = None) -> tuple[str, dict[str, float]]:
+    """
+    Escolhe o backend mais rápido para esta máquina e esta função de aptidão: avalia uma amostra da
+    população com cada candidato (após um aquecimento, para não contar a criação de processos)
+    e mede avaliações por segundo.
+
+    Retorna:
+    --------
+    tuple[str, dict[str, float]] : nome do backend escolhido e a vazão medida de cada candidato.
+    """
+    cpus = workers or os.cpu_count() or 1
+    sample = population[:sample_size or min(len(population), max(64, 8 * cpus))]
+
+    candidates = ['serial']
+    if hasattr(fitness_functions[0], 'evaluate_population'):
+        candidates.append('batched')
+    if cpus > 1:
+        candidates += ['thread', 'process']
+
+    throughput = {}
+    for name in candidates:
+        with create_backend(name, fitness_functions, population.shape, workers, chunk_size, population.dtype) as backend:
+            backend.evaluate(sample[:cpus])  # Aquecimento
+            start = time.perf_counter()
+            backend.evaluate(sample)
+            throughput[name] = len(sample) / (time.perf_counter() - start)
+    return max(throughput, key=throughput.get), throughput
@@ -0,0 +1,90 @@
+import numpy as np
+from model import BatchedMultilayerPerceptron, Minimax
+from model._game_table import WIN_LINES
+
+_LINES = np.array(WIN_LINES, dtype=np.intp)
+
+ONGOING = 2
+INVALID = -2
+
+
+def board_status(boards: np.ndarray) -> np.ndarray:
+    """
+    Estado de um lote de tabuleiros (n, 9), com os mesmos códigos de Board.check_win:
+    1 (X venceu), -1 (O venceu), 0 (empate) e 2 (em andamento).
+    """
+    sums = boards[:, _LINES].sum(axis=2, dtype=np.int8)
+    status = np.full(len(boards), ONGOING, dtype=np.int8)
+    status[(boards != 0).all(axis=1)] = 0
+    status[(sums == -3).any(axis=1)] = -1
+    status[(sums == 3).any(axis=1)] = 1
+    return status
+
+
+class BatchSimulator:
+    """
+    Simulador vetorizado que avança N partidas em paralelo, jogada a jogada.
+
+    Cada indivíduo da população joga todas as partidas do pipeline ao mesmo tempo:
+    os tabuleiros ficam num array (pop, n_games, 9) de int8, partidas encerradas são
+    mascaradas e a detecção de vitória é feita com operações de array. Os resultados
+    usam os mesmos códigos de FitnessEvaluator._play:
+        1 vitória do MLP, 0 empate, -1 derrota, -2 jogada inválida.
+
+    Parâmetros:
+    -----------
+    learner : BatchedMultilayerPerceptron
+        Lote de redes, uma por indivíduo (joga como X).
+    trainer : Minimax
+        Oponente (joga como O), consultado em lote via predict_batch.
+    """
+
+    def __init__(self, learner: BatchedMultilayerPerceptron, trainer: Minimax):
+        self._learner = learner
+        self._trainer = trainer
+
+    def play(self, population: np.ndarray, randomness: np.ndarray) -> np.ndarray:
+        """
+        Joga len(randomness) partidas por indivíduo.
+
+        Parâmetros:
+        -----------
+        population : np.ndarray
+            Matriz (pop, n_weights) de pesos.
+        randomness : np.ndarray
+            Aleatoriedade do Minimax em cada partida do pipeline (n_games,).
+
+        Retorna:
+        --------
+        np.ndarray : resultados (pop, n_games) em int8.
+        """
+        self._learner.update(population)
+        pop_size, n_games = len(population), len(randomness)
+
+        boards = np.zeros((pop_size, n_games, 9), dtype=np.int8)
+        results = np.full((pop_size, n_games), ONGOING, dtype=np.int8)
+        flat_boards = boards.reshape(-1, 9)
+        flat_results = results.reshape(-1)
+        game_randomness = np.broadcast_to(np.asarray(randomness, dtype=float), (pop_size, n_games)).reshape(-1)
+
+        while True:
+            # Jogada do MLP (X)
+            active = np.flatnonzero(flat_results == ONGOING)
+            if not len(active):
+                break
+            moves = self._learner.predict(boards, active=results == ONGOING).reshape(-1)[active]
+            invalid = flat_boards[active, moves] != 0
+            flat_results[active[invalid]] = INVALID
+            active, moves = active[~invalid], moves[~invalid]
+            flat_boards[active, moves] = 1
+            flat_results[active] = board_status(flat_boards[active])
+
+            # Jogada do Minimax (O)
+            active = active[flat_results[active] == ONGOING]
+            if not len(active):
+                break
+            moves = self._trainer.predict_batch(flat_boards[active], game_randomness[active])
+            flat_boards[active, moves] = -1
+            flat_results[active] = board_status(flat_boards[active])
+
+        return results
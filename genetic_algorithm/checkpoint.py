@@ -0,0 +1,59 @@
+import os
+import json
+import random
+import numpy as np
+
+
+def save_checkpoint(path: str, state: dict) -> None:
+    """
+    Grava o estado do AG em formato .npz (sem pickle). A escrita é atômica:
+    grava num arquivo temporário e o renomeia sobre o destino.
+
+    Parâmetros:
+    -----------
+    path : str
+        Caminho do checkpoint.
+    state : dict
+        Arrays numpy e escalares; dicts/tuplas (ex.: estados de RNG) são gravados como JSON.
+    """
+    arrays = {}
+    for name, value in state.items():
+        if isinstance(value, (dict, tuple, list)):
+            arrays[name] = np.array(json.dumps(value))
+        else:
+            arrays[name] = np.asarray(value)
+
+    tmp_path = f'{path}.tmp'
+    with open(tmp_path, 'wb') as f:
+        np.savez(f, **arrays)
+    os.replace(tmp_path, path)
+
+
+def load_checkpoint(path: str, json_fields: tuple[str, ...] = ()) -> dict:
+    """
+    Lê um checkpoint gravado por save_checkpoint. Os campos em json_fields são decodificados de volta.
+    """
+    with np.load(path, allow_pickle=False) as data:
+        state = {name: data[name] for name in data.files}
+    for name in json_fields:
+        if name in state:
+            state[name] = json.loads(str(state[name]))
+    return state
+
+
+def rng_states() -> dict:
+    """
+    Estados dos geradores globais usados na avaliação (random e np.random), serializáveis em JSON.
+    """
+    np_state = np.random.get_state()
+    return {
+        "random": random.getstate(),
+        "np_random": [np_state[0], np_state[1].tolist(), *np_state[2:]],
+    }
+
+
+def restore_rng_states(states: dict) -> None:
+    version, internal, gauss_next = states["random"]
+    random.setstate((version, tuple(internal), gauss_next))
+    name, keys, pos, has_gauss, cached_gaussian = states["np_random"]
+    np.random.set_state((name, np.array(keys, dtype=np.uint32), pos, has_gauss, cached_gaussian))
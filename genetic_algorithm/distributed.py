@@ -0,0 +1,365 @@
+import os
+import sys
+import time
+import queue
+import pickle
+import socket
+import itertools
+import threading
+import traceback
+import numpy as np
+import multiprocessing as mp
+from multiprocessing.managers import BaseManager
+
+# Avaliação distribuída: o coordenador publica, via multiprocessing.managers sobre TCP, o quadro de tarefas,
+# duas filas (resultados e eventos) e a configuração (funções de aptidão serializadas uma única vez).
+#
+# Tarefa:    (task_id, function_index, cutoff, dtype, n_genes, bytes)  -> bloco de cromossomos em float binário
+# Resultado: (task_id, worker_id, bytes float64 | None, avaliações interrompidas pelo cutoff, erro | None)
+# Evento:    ('heartbeat', worker_id, None)
+#
+# Trabalhadores remotos: python worker.py HOST:PORTA --authkey CHAVE
+
+
+class _TaskBoard:
+    """
+    Fila de tarefas do processo servidor. take() retira a tarefa e registra o trabalhador dono na mesma
+    chamada, então toda tarefa fora da fila tem dono; requeue() devolve uma tarefa e apaga o dono atomicamente.
+    Tarefas com id abaixo de finish(next_id) são de avaliações já concluídas: cópias restantes são descartadas.
+    """
+
+    def __init__(self):
+        self._tasks = queue.Queue()
+        self._owners = {}
+        self._stale_below = 0
+        self._lock = threading.Lock()
+
+    def put(self, task) -> None:
+        self._tasks.put(task)
+
+    def take(self, worker_id: str):
+        while True:
+            task = self._tasks.get()
+            with self._lock:
+                if task is None:
+                    return None
+                if task[0] >= self._stale_below:
+                    self._owners[task[0]] = worker_id
+                    return task
+
+    def owners(self) -> dict[int, str]:
+        with self._lock:
+            return dict(self._owners)
+
+    def requeue(self, task) -> None:
+        with self._lock:
+            self._owners.pop(task[0], None)
+            self._tasks.put(task)
+
+    def finish(self, next_id: int) -> None:
+        with self._lock:
+            self._stale_below = next_id
+            self._owners = {task_id: worker for task_id, worker in self._owners.items() if task_id >= next_id}
+
+
+# Estado do processo servidor (quadro de tarefas, filas e configuração), criado pelo initializer do gerenciador.
+_server = {}
+
+
+def _init_server(config: bytes) -> None:
+    _server['board'] = _TaskBoard()
+    _server['results'] = queue.Queue()
+    _server['events'] = queue.Queue()
+    _server['config'] = config
+
+
+# Funções nomeadas (e não lambdas): com os métodos spawn e forkserver, o gerenciador as serializa com pickle.
+def _get_board():
+    return _server['board']
+
+
+def _get_results():
+    return _server['results']
+
+
+def _get_events():
+    return _server['events']
+
+
+def _get_config():
+    return _server['config']
+
+
+class _CoordinatorManager(BaseManager):
+    pass
+
+
+class _WorkerManager(BaseManager):
+    pass
+
+
+for _getter in (_get_board, _get_results, _get_events, _get_config):
+    _CoordinatorManager.register(_getter.__name__[1:], callable=_getter)
+    _WorkerManager.register(_getter.__name__[1:])
+
+
+def _heartbeat(events, worker_id: str, interval: float, stop: threading.Event) -> None:
+    while not stop.wait(interval):
+        try:
+            events.put(('heartbeat', worker_id, None))
+        except (OSError, EOFError):
+            return
+
+
+def run_worker(address: tuple[str, int], authkey: bytes, heartbeat_interval: float = 1.0, worker_id: str | None = None) -> None:
+    """
+    Conecta-se ao coordenador e avalia blocos de cromossomos até receber o sinal de parada (None)
+    ou perder a conexão. Envia um heartbeat a cada heartbeat_interval segundos.
+    """
+    manager = _WorkerManager(address=tuple(address), authkey=authkey)
+    manager.connect()
+    board, results, events = manager.get_board(), manager.get_results(), manager.get_events()
+    fitness_functions = pickle.loads(manager.get_config()._getvalue())
+    worker_id = worker_id or f"{socket.gethostname()}:{os.getpid()}"
+
+    stop = threading.Event()
+    threading.Thread(target=_heartbeat, args=(events, worker_id, heartbeat_interval, stop), daemon=True).start()
+    events.put(('heartbeat', worker_id, None))
+    try:
+        while True:
+            task = board.take(worker_id)
+            if task is None:
+                break
+            task_id, function_index, cutoff, dtype, n_genes, payload = task
+            try:
+                population = np.frombuffer(payload, dtype=dtype).reshape(-1, n_genes)
+                fitness_function = fitness_functions[function_index]
+                aborted = getattr(fitness_function, 'aborted', 0)
+                scores = np.array([
+                    fitness_function(chromosome) if cutoff is None else fitness_function(chromosome, cutoff)
+                    for chromosome in population
+                ], dtype='<f8')
+                aborted = getattr(fitness_function, 'aborted', 0) - aborted
+                results.put((task_id, worker_id, scores.tobytes(), aborted, None))
+            except Exception:
+                results.put((task_id, worker_id, None, 0, traceback.format_exc()))
+    except (OSError, EOFError):
+        pass  # Coordenador encerrado
+    finally:
+        stop.set()
+
+
+class DistributedCoordinator:
+    """
+    Backend de avaliação distribuída: divide a população em blocos, codificados como arrays float
+    binários (não listas serializadas com pickle), e os entrega a qualquer número de trabalhadores,
+    locais ou em outras máquinas, que se conectam por TCP ao servidor multiprocessing.managers do
+    coordenador. As funções de aptidão são serializadas uma única vez e buscadas por cada trabalhador
+    ao conectar.
+
+    Tolerância a falhas: cada trabalhador envia heartbeats; um bloco em andamento num trabalhador sem
+    heartbeat há mais de heartbeat_timeout segundos volta para a fila (resultados duplicados são descartados).
+    O trabalhador retira o bloco e é registrado como dono numa única chamada ao servidor, então todo bloco fora
+    da fila tem dono. Cópias devolvidas à fila e não usadas são descartadas ao fim de cada evaluate().
+    Sem nenhum trabalhador ativo por worker_timeout segundos, evaluate() falha.
+
+    Usado como backend do GeneticAlgorithm (backend=DistributedCoordinator(...)) ou diretamente, como
+    gerenciador de contexto, com evaluate(population).
+
+    Parâmetros:
+    -----------
+    fitness_function : function
+        Função de aptidão (serializável com pickle, como o FitnessEvaluator).
+    address : tuple[str, int], default=('127.0.0.1', 0)
+        Endereço do servidor. A porta 0 escolhe uma porta livre (ver self.address após open()).
+        Use ('0.0.0.0', PORTA) para aceitar trabalhadores de outras máquinas.
+    authkey : bytes, opcional
+        Chave de autenticação compartilhada com os trabalhadores. Por padrão, aleatória (self.authkey).
+    local_workers : int, default=0
+        Trabalhadores iniciados como processos locais em open() (modo de teste em localhost).
+        Todos os trabalhadores, locais ou remotos, encerram quando o coordenador é fechado.
+    chunk_size : int, default=64
+        Cromossomos por tarefa.
+    dtype : opcional
+        Tipo dos floats enviados. Por padrão, o da população (np.float32 reduz o tráfego pela metade).
+    heartbeat_interval : float, default=1.0
+        Intervalo entre heartbeats dos trabalhadores locais e entre verificações de tarefas perdidas.
+    heartbeat_timeout : float, default=10.0
+        Tempo sem heartbeat após o qual um trabalhador é considerado perdido.
+    worker_timeout : float, default=60.0
+        Tempo máximo que evaluate() espera sem nenhum trabalhador ativo antes de lançar RuntimeError.
+    extra_functions : tuple, opcional
+        Funções de aptidão adicionais (ex.: triagem), selecionadas em evaluate() por function_index >= 1.
+
+    Atributos:
+    ----------
+    ipc_seconds : float
+        Tempo acumulado codificando a população e decodificando os resultados.
+    requeued : int
+        Tarefas devolvidas à fila por perda de trabalhador.
+    aborted : int
+        Avaliações interrompidas pelo cutoff, somadas de todos os trabalhadores.
+    """
+    name = 'distributed'
+    supports_cutoff = True
+
+    def __init__(self, fitness_function, address: tuple[str, int] = ('127.0.0.1', 0), authkey: bytes | None = None,
+                 local_workers: int = 0, chunk_size: int = 64, dtype=None, heartbeat_interval: float = 1.0,
+                 heartbeat_timeout: float = 10.0, worker_timeout: float = 60.0, extra_functions: tuple = ()):
+        self._fitness_functions = (fitness_function, *extra_functions)
+        self._bind_address = tuple(address)
+        self.authkey = authkey or os.urandom(16).hex().encode()
+        self._n_local_workers = local_workers
+        self._chunk_size = chunk_size
+        self._dtype = np.dtype(dtype).newbyteorder('<') if dtype is not None else None
+        self._heartbeat_interval = heartbeat_interval
+        self._heartbeat_timeout = heartbeat_timeout
+        self._worker_timeout = worker_timeout
+        self._server = None
+        self._open_count = 0
+        self._local_workers = []
+        self._task_ids = itertools.count()
+        self.address = None
+        self.ipc_seconds = 0.0
+        self.requeued = 0
+        self.aborted = 0
+
+    def __enter__(self) -> 'DistributedCoordinator':
+        self.open()
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def open(self) -> None:
+        """
+        Inicia o servidor e os trabalhadores locais. Aberturas aninhadas (ex.: o GeneticAlgorithm usando
+        um coordenador já aberto pelo chamador) reutilizam o mesmo servidor até o close() correspondente.
+        """
+        self._open_count += 1
+        if self._server is not None:
+            return
+        self._last_seen = {}
+
+        # O servidor (filas e configuração) roda num processo próprio, encerrado em close()
+        self._server = _CoordinatorManager(address=self._bind_address, authkey=self.authkey)
+        self._server.start(initializer=_init_server, initargs=(pickle.dumps(self._fitness_functions),))
+        self.address = self._server.address
+        self._board, self._results, self._events = self._server.get_board(), self._server.get_results(), self._server.get_events()
+
+        ctx = mp.get_context()
+        for i in range(self._n_local_workers):
+            process = ctx.Process(target=run_worker, args=(self.address, self.authkey, self._heartbeat_interval, f"local-{i}"), daemon=True)
+            process.start()
+            self._local_workers.append(process)
+
+    def close(self) -> None:
+        """
+        Encerra o servidor. Cada trabalhador conhecido (local ou remoto) recebe o sinal de parada.
+        """
+        self._open_count = max(self._open_count - 1, 0)
+        if self._server is None or self._open_count:
+            return
+        self._drain_events()
+        for _ in range(max(len(self._last_seen), len(self._local_workers))):
+            self._board.put(None)
+        for process in self._local_workers:
+            process.join(timeout=5)
+            if process.is_alive():
+                process.terminate()
+        self._local_workers = []
+        self._board = self._results = self._events = None
+        self._server.shutdown()
+        self._server = None
+
+    def workers(self) -> list[str]:
+        """
+        Trabalhadores com heartbeat recente.
+        """
+        self._drain_events()
+        now = time.monotonic()
+        return [worker for worker, seen in self._last_seen.items() if now - seen <= self._heartbeat_timeout]
+
+    def _drain_events(self) -> None:
+        while True:
+            try:
+                _, worker, _ = self._events.get_nowait()
+            except queue.Empty:
+                return
+            self._last_seen[worker] = time.monotonic()
+
+    def _requeue_lost(self, pending: dict) -> None:
+        """
+        Devolve à fila as tarefas em andamento cujo trabalhador dono está sem heartbeat há mais de heartbeat_timeout.
+        """
+        now = time.monotonic()
+        for task_id, worker in self._board.owners().items():
+            seen = self._last_seen.setdefault(worker, now)  # Dono ainda sem heartbeat recebido: conta a partir de agora
+            if task_id in pending and now - seen > self._heartbeat_timeout:
+                self._board.requeue(pending[task_id][1])
+                self.requeued += 1
+                print(f"DistributedCoordinator : Trabalhador {worker} perdido : Tarefa {task_id} devolvida à fila", file=sys.stderr)
+
+    def _check_workers(self) -> None:
+        """
+        Lança RuntimeError se nenhum trabalhador enviou heartbeat há mais de worker_timeout segundos.
+        """
+        now = time.monotonic()
+        if self.workers():
+            self._idle_since = None
+        elif self._idle_since is None:
+            self._idle_since = now
+        elif now - self._idle_since > self._worker_timeout:
+            raise RuntimeError(f"DistributedCoordinator : Nenhum trabalhador ativo há {self._worker_timeout:.0f}s "
+                               f"(conecte trabalhadores a {self.address} ou use local_workers)")
+
+    def evaluate(self, population: np.ndarray, function_index: int = 0, cutoff: float | None = None) -> np.ndarray:
+        """
+        Avalia a população nos trabalhadores conectados e retorna a aptidão de cada cromossomo.
+        """
+        n, n_genes = population.shape
+        scores = np.empty(n)
+        pending = {}
+        dtype = self._dtype or population.dtype.newbyteorder('<')
+
+        start = time.perf_counter()
+        for i in range(0, n, self._chunk_size):
+            task_id = next(self._task_ids)
+            chunk = slice(i, min(i + self._chunk_size, n))
+            payload = np.ascontiguousarray(population[chunk], dtype=dtype).tobytes()
+            task = (task_id, function_index, cutoff, dtype.str, n_genes, payload)
+            pending[task_id] = (chunk, task)
+            self._board.put(task)
+        self.ipc_seconds += time.perf_counter() - start
+
+        try:
+            self._collect(pending, scores)
+        finally:
+            self._board.finish(next(self._task_ids))  # Cópias devolvidas à fila e ainda não retiradas são descartadas
+        return scores
+
+    def _collect(self, pending: dict, scores: np.ndarray) -> None:
+        """
+        Recebe os resultados até concluir todas as tarefas pendentes, devolvendo à fila as de trabalhadores perdidos.
+        """
+        self._idle_since = None
+        while pending:
+            self._drain_events()
+            self._requeue_lost(pending)
+            self._check_workers()
+            try:
+                task_id, worker, data, aborted, error = self._results.get(timeout=self._heartbeat_interval)
+            except queue.Empty:
+                continue
+            if task_id not in pending:
+                continue  # Resultado duplicado de uma tarefa devolvida à fila
+            if error is not None:
+                raise RuntimeError(f"DistributedCoordinator : Tarefa {task_id} falhou em {worker}:\n{error}")
+
+            start = time.perf_counter()
+            chunk, _ = pending.pop(task_id)
+            scores[chunk] = np.frombuffer(data, dtype='<f8')
+            self.aborted += aborted
+            self.ipc_seconds += time.perf_counter() - start
+        return scores
+
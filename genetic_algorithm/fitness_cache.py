@@ -0,0 +1,116 @@
+import hashlib
+import numpy as np
+
+
+class FitnessCache:
+    """
+    Memória de aptidão entre gerações, indexada pelo hash do conteúdo do cromossomo.
+
+    As elites passam inalteradas para a geração seguinte; se a avaliação for
+    determinística, a aptidão delas é reaproveitada sem jogar de novo. Em modos
+    estocásticos, todo cromossomo é reavaliado e a aptidão reportada é a média de
+    todas as amostras já obtidas para ele.
+
+    Só são mantidas as entradas da população atual, então o tamanho fica limitado a pop_size.
+
+    Parâmetros:
+    -----------
+    deterministic : bool
+        Se True, cromossomos já avaliados não são reavaliados.
+
+    Atributos:
+    ----------
+    evaluations : int
+        Avaliações efetivamente executadas.
+    evaluations_saved : int
+        Avaliações evitadas por acerto no cache.
+    """
+
+    def __init__(self, deterministic: bool):
+        self._deterministic = deterministic
+        self._entries = {}  # hash -> (soma das aptidões, número de amostras)
+        self.evaluations = 0
+        self.evaluations_saved = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @staticmethod
+    def key(chromosome: np.ndarray) -> bytes:
+        return hashlib.blake2b(np.ascontiguousarray(chromosome).tobytes(), digest_size=16).digest()
+
+    def evaluate(self, population: np.ndarray, evaluate, cutoff: float | None = None) -> np.ndarray:
+        """
+        Retorna a aptidão de cada cromossomo, chamando evaluate(subpopulação) apenas para os pendentes.
+
+        Com cutoff, resultados abaixo do corte podem ser apenas limites (avaliação interrompida):
+        são retornados, mas não entram no cache nem nas médias.
+        """
+        keys = [self.key(chromosome) for chromosome in population]
+        if self._deterministic:
+            pending = [i for i, key in enumerate(keys) if key not in self._entries]
+        else:
+            pending = list(range(len(keys)))
+
+        bounds = {}
+        if pending:
+            scores = evaluate(population[pending])
+            for i, score in zip(pending, scores):
+                if cutoff is not None and score < cutoff:
+                    bounds[i] = float(score)
+                    continue
+                total, count = self._entries.get(keys[i], (0.0, 0))
+                self._entries[keys[i]] = (total + float(score), count + 1)
+
+        self.evaluations += len(pending)
+        self.evaluations_saved += len(keys) - len(pending)
+
+        # Descarta cromossomos que não estão mais na população
+        self._entries = {key: self._entries[key] for key in keys if key in self._entries}
+        return np.array([
+            bounds[i] if i in bounds else self._entries[key][0] / self._entries[key][1]
+            for i, key in enumerate(keys)
+        ])
+
+    def lookup(self, population: np.ndarray) -> np.ndarray:
+        """
+        Aptidão já conhecida de cada cromossomo (NaN se ausente). Em modo estocástico, sempre NaN.
+        """
+        known = np.full(len(population), np.nan)
+        if self._deterministic:
+            for i, chromosome in enumerate(population):
+                entry = self._entries.get(self.key(chromosome))
+                if entry is not None:
+                    known[i] = entry[0] / entry[1]
+        return known
+
+    def stats(self) -> dict:
+        total = self.evaluations + self.evaluations_saved
+        return {
+            "size": len(self._entries),
+            "evaluations": self.evaluations,
+            "evaluations_saved": self.evaluations_saved,
+            "hit_rate": self.evaluations_saved / total if total else 0.0,
+        }
+
+    def state(self) -> dict:
+        """
+        Estado serializável do cache (para checkpoints).
+        """
+        keys = list(self._entries)
+        return {
+            "cache_keys": np.frombuffer(b''.join(keys), dtype=np.uint8).reshape(len(keys), 16),
+            "cache_totals": np.array([self._entries[key][0] for key in keys], dtype=float),
+            "cache_counts": np.array([self._entries[key][1] for key in keys], dtype=np.int64),
+            "cache_evaluations": self.evaluations,
+            "cache_evaluations_saved": self.evaluations_saved,
+        }
+
+    def load_state(self, state: dict) -> None:
+        keys = [bytes(row) for row in state["cache_keys"]]
+        self._entries = {
+            key: (float(total), int(count))
+            for key, total, count in zip(keys, state["cache_totals"], state["cache_counts"])
+        }
+        self.evaluations = int(state["cache_evaluations"])
+        self.evaluations_saved = int(state["cache_evaluations_saved"])
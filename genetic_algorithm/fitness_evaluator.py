@@ -1,21 +1,152 @@
+import copy
+import numpy as np
 from .tictactoe.board import Board as tictactoe
-from model import IModel
+from .batch_simulator import BatchSimulator
+from model import IModel, BatchedMultilayerPerceptron
+from model._game_table import get_game_table
+from model.multilayer_perceptron import _mask_stats
 
 
 # RODA EM PARALELO! NÃO ADICIONAR PRINTS NESSA CLASSE!
 class FitException(Exception):
     pass
 class FitnessEvaluator:
-    def __init__(self, learner: IModel, trainer: IModel, pipeline:dict[str], verbose:bool=False):
+    """
+    Avalia cromossomos jogando o pipeline de partidas do learner (X) contra o trainer (O).
+
+    Partidas em que nenhum dos jogadores tem aleatoriedade (ex.: MLP contra Minimax 'hard')
+    são sempre iguais, então cada modo determinístico é jogado uma única vez e a pontuação
+    é multiplicada pelo número de ocorrências no pipeline.
+
+    Com exhaustive=True, os modos estocásticos também deixam de ser amostrados: a pontuação
+    é o valor esperado exato, somando todos os ramos de resposta do oponente ponderados pela
+    probabilidade dada por trainer.move_distribution() (requer um trainer Minimax).
+
+    O atributo aborted conta as avaliações interrompidas pelo cutoff (em cada cópia do avaliador;
+    os backends somam os incrementos de cada processo ou thread).
+    """
+
+    def __init__(self, learner: IModel, trainer: IModel, pipeline:dict[str], verbose:bool=False, exhaustive:bool=False):
         self._learner = learner
         self._trainer = trainer
         self._pipeline = pipeline
         self._verbose = verbose
+        self._exhaustive = exhaustive
+        self._simulator = None
+        self._batched_learner = None
+        self.aborted = 0
+
+        if exhaustive and not hasattr(trainer, 'move_distribution'):
+            raise ValueError("FitnessEvaluator : exhaustive=True requer um trainer com move_distribution()")
+
+        # (modo, ocorrências no pipeline, partida determinística?) na ordem da primeira ocorrência
+        learner_deterministic = learner.is_deterministic()
+        self._schedule = [
+            (mode, list(pipeline).count(mode), learner_deterministic and self._is_deterministic_mode(mode))
+            for mode in dict.fromkeys(pipeline)
+        ]
+        self._deterministic = all(deterministic for _, _, deterministic in self._schedule)
+
+    def __call__(self, chromosome:list[float], cutoff:float|None=None):
+        return self._evaluate_fitness(chromosome, cutoff)
+
+    def is_deterministic(self) -> bool:
+        """
+        Indica se a aptidão de um cromossomo é sempre a mesma (nenhum jogador com aleatoriedade no pipeline).
+        """
+        return self._deterministic
+
+    def max_score(self) -> float:
+        """
+        Maior aptidão possível no pipeline: vitória em todas as partidas (limite superior, ver achievable_score).
+        """
+        return sum(count * self._compute_score(mode, 1) for mode, count, _ in self._schedule)
+
+    def achievable_score(self) -> float:
+        """
+        Maior aptidão esperada que um learner perfeito alcança no pipeline: em cada modo, o valor
+        expectimax do tabuleiro vazio (o learner maximiza, o trainer segue move_distribution()).
+        Contra o Minimax 'hard' é o empate; nos modos com aleatoriedade, o melhor valor esperado.
+        Sem move_distribution(), usa o valor resolvido (empate) nos modos determinísticos e a vitória nos demais.
+
+        Como limiar de parada, é um valor sem ruído: compare-o com expected_score(), não com uma amostra.
+        """
+        total = 0.0
+        for mode, count, _ in self._schedule:
+            trainer = copy.copy(self._trainer)  # Não altera o modo do trainer
+            trainer.update(mode)
+            if hasattr(trainer, 'move_distribution'):
+                total += count * self._expectimax(mode, trainer, tictactoe(), {})
+            else:
+                solved = get_game_table().value([0] * 9)
+                total += count * self._compute_score(mode, solved if trainer.is_deterministic() else 1)
+        return total
+
+    def _expectimax(self, mode: str, trainer: IModel, board: tictactoe, memo: dict) -> float:
+        """
+        Maior pontuação esperada do learner (X da vez) a partir do tabuleiro, contra a distribuição de jogadas do trainer.
+        """
+        key = tuple(board.board)
+        if key in memo:
+            return memo[key]
+
+        best = -np.inf
+        for p1_play in [i for i, cell in enumerate(board.board) if cell == 0]:
+            board.update_board(1, p1_play)
+            if not board.is_ongoing():
+                value = self._compute_score(mode, board.check_win())
+            else:
+                value = 0.0
+                for p2_play, probability in trainer.move_distribution(board.board).items():
+                    board.update_board(-1, p2_play)
+                    if board.is_ongoing():
+                        value += probability * self._expectimax(mode, trainer, board, memo)
+                    else:
+                        value += probability * self._compute_score(mode, board.check_win())
+                    board.undo(p2_play)
+            board.undo(p1_play)
+            best = max(best, value)
+
+        memo[key] = best
+        return best
+
+    def expected_score(self, chromosome: list[float]) -> float | None:
+        """
+        Aptidão esperada exata do cromossomo (sem ruído de amostragem), somando todos os ramos de resposta
+        do trainer ponderados por move_distribution(). None se o trainer não oferecer move_distribution().
+        """
+        if not hasattr(self._trainer, 'move_distribution'):
+            return None
+        self._learner.update(chromosome)
+        return sum(count * self._expected_mode_score(mode) for mode, count, _ in self._schedule)
+
+    def _expected_mode_score(self, mode: str) -> float:
+        self._trainer.update(mode)
+        outcomes = self._expected_outcomes(tictactoe())
+        return sum(p * self._compute_score(mode, code) for code, p in outcomes.items())
+
+    def mask_stats(self) -> dict | None:
+        """
+        Estatísticas da inferência mascarada do learner (somando o caminho em lote), ou None se ele não usar máscara.
+
+        Com avaliação em processos, as predições feitas nos workers não são contadas aqui.
+        """
+        if not getattr(self._learner, 'is_masked', lambda: False)():
+            return None
+        stats = [self._learner.mask_stats()]
+        if self._batched_learner is not None:
+            stats.append(self._batched_learner.mask_stats())
+        return _mask_stats(sum(s["predictions"] for s in stats), sum(s["overrides"] for s in stats))
 
-    def __call__(self, chromosome:list[float]):
-        return self._evaluate_fitness(chromosome)
+    def _is_deterministic_mode(self, mode: str) -> bool:
+        """
+        Indica se o trainer é determinístico no modo dado. Consulta uma cópia rasa, sem alterar o modo do trainer.
+        """
+        probe = copy.copy(self._trainer)
+        probe.update(mode)
+        return probe.is_deterministic()
 
-    def _evaluate_fitness(self, chromosome: list[float]) -> float:
+    def _evaluate_fitness(self, chromosome: list[float], cutoff: float | None = None) -> float:
         """
         Função de aptidão para o Algoritmo Genético.
 
@@ -23,6 +154,10 @@ class FitnessEvaluator:
         -----------
         chromosome : list[float]
             Vetor linear de pesos da rede MLP.
+        cutoff : float, opcional
+            Corte (ex.: fronteira da elite na geração anterior). Assim que nem vencendo todas as
+            partidas restantes a aptidão alcançaria o corte, a avaliação é interrompida e retorna
+            esse limite superior (sempre abaixo do corte).
 
         Retorna:
         --------
@@ -34,16 +169,90 @@ class FitnessEvaluator:
         """
         self._learner.update(chromosome)
         learner_fitness = 0
+        remaining_best = self.max_score()  # Aptidão máxima ainda alcançável nas partidas restantes
+        board = None
 
-        for mode in self._pipeline:
+        for mode, count, deterministic in self._schedule:
             self._trainer.update(mode)
-            insights, board = self._play(self._learner, self._trainer)
+            best = self._compute_score(mode, 1)
+            if self._exhaustive:
+                learner_fitness += count * self._expected_mode_score(mode)
+                remaining_best -= count * best
+            elif deterministic:
+                insights, board = self._play(self._learner, self._trainer)
+                learner_fitness += count * self._compute_score(mode, insights)
+                remaining_best -= count * best
+            else:
+                for _ in range(count):
+                    insights, board = self._play(self._learner, self._trainer)
+                    learner_fitness += self._compute_score(mode, insights)
+                    remaining_best -= best
+                    if self._can_abort(learner_fitness, remaining_best, cutoff):
+                        return self._abort(learner_fitness + remaining_best)
 
-            learner_fitness += self._compute_score(mode, insights)
-        print(f'FitnessEvaluator : Round de jogadas finalizado. Fitness={learner_fitness} : Board={board}')
+            if self._can_abort(learner_fitness, remaining_best, cutoff):
+                return self._abort(learner_fitness + remaining_best)
+        if self._verbose:
+            print(f'FitnessEvaluator : Round de jogadas finalizado. Fitness={learner_fitness} : Board={board}')
 
         return learner_fitness
 
+    @staticmethod
+    def _can_abort(learner_fitness: float, remaining_best: float, cutoff: float | None) -> bool:
+        """
+        Há partidas restantes e nem vencendo todas a aptidão alcançaria o corte.
+        """
+        return cutoff is not None and remaining_best > 0 and learner_fitness + remaining_best < cutoff
+
+    def _abort(self, upper_bound: float) -> float:
+        """
+        Registra uma avaliação interrompida pelo cutoff e retorna o limite superior atingido.
+        """
+        self.aborted += 1
+        return upper_bound
+
+    def evaluate_population(self, population: np.ndarray) -> np.ndarray:
+        """
+        Avalia todos os cromossomos de uma vez com o simulador vetorizado (BatchSimulator).
+
+        Requer um learner MultilayerPerceptron e um trainer Minimax. Produz as mesmas
+        pontuações de _evaluate_fitness, mas joga todas as partidas da população e do
+        pipeline em lockstep, sem processos. Com exhaustive=True, avalia um cromossomo por vez.
+
+        Parâmetros:
+        -----------
+        population : np.ndarray
+            Matriz (pop, n_weights), um cromossomo por linha.
+
+        Retorna:
+        --------
+        np.ndarray : aptidão de cada cromossomo (pop,).
+        """
+        population = np.asarray(population)
+        if self._exhaustive:
+            return np.array([self._evaluate_fitness(chromosome) for chromosome in population], dtype=float)
+
+        if self._simulator is None:
+            self._batched_learner = BatchedMultilayerPerceptron.from_model(self._learner, len(population))
+            self._simulator = BatchSimulator(self._batched_learner, self._trainer)
+
+        # Modos determinísticos são jogados uma vez, com peso igual ao número de ocorrências
+        games, weights = [], []
+        for mode, count, deterministic in self._schedule:
+            games += [mode] if deterministic else count * [mode]
+            weights += [count] if deterministic else count * [1]
+
+        randomness = []
+        for mode in games:
+            self._trainer.update(mode)
+            randomness.append(self._trainer.randomness)
+        results = self._simulator.play(population, np.array(randomness))
+
+        # Pontuação de cada resultado (-2, -1, 0, 1) em cada partida jogada
+        codes = (-2, -1, 0, 1)
+        scores = np.array([[weight * self._compute_score(mode, code) for code in codes] for mode, weight in zip(games, weights)])
+        return scores[np.arange(len(games)), results.astype(np.intp) + 2].sum(axis=1)
+
     def _play(self, player1:IModel, player2:IModel) -> tuple[int, list[int]] | None:
         """
         Executa uma partida entre dois agentes com método predict().
@@ -72,6 +281,32 @@ class FitnessEvaluator:
 
         return ttt.check_win(), ttt.board
 
+    def _expected_outcomes(self, board: tictactoe) -> dict[int, float]:
+        """
+        Probabilidade exata de cada resultado (1, 0, -1, -2) a partir do tabuleiro, com X da vez,
+        percorrendo todos os ramos de resposta do trainer no modo atual.
+        """
+        p1_play = self._learner.predict(board.board)
+        if not board.update_board(1, p1_play):
+            return {-2: 1.0}
+
+        outcomes = {}
+        if not board.is_ongoing():
+            outcomes[board.check_win()] = 1.0
+        else:
+            for p2_play, probability in self._trainer.move_distribution(board.board).items():
+                board.update_board(-1, p2_play)
+                if board.is_ongoing():
+                    for code, p in self._expected_outcomes(board).items():
+                        outcomes[code] = outcomes.get(code, 0.0) + probability * p
+                else:
+                    code = board.check_win()
+                    outcomes[code] = outcomes.get(code, 0.0) + probability
+                board.undo(p2_play)
+
+        board.undo(p1_play)
+        return outcomes
+
     def _compute_score(self, mode: str, insights: int) -> float:
         if mode == 'easy':
             good = 1
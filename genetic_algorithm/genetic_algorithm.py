@@ -1,9 +1,12 @@
-import random
+import time
 import numpy as np
 
 # Optimization
-from concurrent.futures import ThreadPoolExecutor
-from multiprocessing import Pool
+from concurrent.futures import Executor, ThreadPoolExecutor
+from .backends import create_backend, calibrate
+from .fitness_cache import FitnessCache
+from .checkpoint import save_checkpoint, load_checkpoint, rng_states, restore_rng_states
+from .metrics import PhaseTimer, format_generation
 
 class GeneticAlgorithm:
     """
@@ -17,35 +20,110 @@ class GeneticAlgorithm:
     chromosome_size : int
         Número de genes (pesos) em cada cromossomo.
     fitness_function : function
-        Função de aptidão que recebe um cromossomo (lista de floats) e retorna um valor numérico (fitness).
+        Função de aptidão que recebe um cromossomo (np.ndarray de floats) e retorna um valor numérico (fitness).
     max_iter : int, default=100
         Número máximo de gerações para executar o algoritmo.
+    batched : bool, default=False
+        Se True, avalia a população inteira de uma vez via fitness_function.evaluate_population
+        (simulador vetorizado do FitnessEvaluator), sem processos. Equivale a backend='batched'.
+    optimized : bool, default=True
+        Se True (e batched=False), avalia em paralelo num pool de processos persistente,
+        criado uma vez por run(), com a população em memória compartilhada. Equivale a backend='process'.
+    n_workers : int, opcional
+        Número de processos (ou threads) do backend. Por padrão, os.cpu_count().
+    chunk_size : int, opcional
+        Cromossomos por tarefa enviada ao backend.
+    seed : int, opcional
+        Semente do numpy.random.Generator que conduz inicialização, seleção, crossover e mutação.
+    cache_fitness : bool, default=True
+        Se True, reaproveita a aptidão de cromossomos inalterados (elites) entre gerações quando
+        fitness_function.is_deterministic() for True; caso contrário, faz a média das reavaliações.
+    checkpoint_path : str, opcional
+        Arquivo .npz onde o estado (população, aptidões, estados dos RNGs, geração e cache) é
+        gravado atomicamente a cada checkpoint_every gerações. Retomado com run(resume_from=...).
+    checkpoint_every : int, default=1
+        Intervalo de gerações entre checkpoints (a última geração sempre é gravada).
+    async_checkpoint : bool, default=True
+        Se True, grava os checkpoints numa thread em segundo plano, sem parar a avaliação.
+    on_generation : function, opcional
+        Callback chamado ao fim de cada geração com um dict de métricas: generation, timings
+        (segundos por fase: evaluation, ipc, selection, crossover, mutation, checkpoint, total),
+        fitness (max, mean, std, min), diversity, evaluations, evals_per_second e cache (ou None).
+    patience : int, opcional
+        Encerra o treinamento se nem a melhor aptidão nem a média melhorarem mais que min_delta
+        por patience gerações seguidas.
+    min_delta : float, default=0.0
+        Melhora mínima considerada pelo critério de patience.
+    min_diversity : float, opcional
+        Encerra o treinamento se a diversidade da população (desvio padrão médio por gene) cair abaixo do limite.
+
+    screening_function : function, opcional
+        Avaliação barata (ex.: FitnessEvaluator com um pipeline curto) usada em duas etapas: todos os
+        indivíduos ainda sem aptidão conhecida passam pela triagem e só a fração screening_keep
+        melhor joga o pipeline completo. Os podados recebem uma estimativa limitada: a pontuação da
+        triagem escalada (screening_scale) e nunca acima da pior aptidão completa da geração.
+    screening_keep : float, default=0.25
+        Fração dos indivíduos triados que avança para a avaliação completa.
+    screening_scale : float, opcional
+        Fator que converte a pontuação da triagem para a escala do pipeline completo. Por padrão, a razão
+        entre os max_score() das duas funções, se existirem, ou 1.
+    early_abort : bool, default=False
+        Se True, passa à fitness_function um corte (cutoff): a aptidão do pior elite da geração anterior.
+        Avaliações que não podem mais alcançá-lo são interrompidas e retornam o limite superior atingido,
+        que fica abaixo do corte e não entra no cache. Ignorado na avaliação em lote (batched). A métrica
+        'aborted' soma as interrupções informadas pelo atributo aborted da função (ex.: FitnessEvaluator).
+
+    backend : str, concurrent.futures.Executor ou backend, opcional
+        Backend de avaliação: 'serial', 'batched', 'thread' (cópia da função por thread; blocos em lote se houver
+        evaluate_population), 'process' (SharedPopulationPool), um Executor externo (blocos de n_workers/chunk_size
+        enviados com submit), um objeto backend (ex.: DistributedCoordinator, para avaliar em outras máquinas)
+        ou 'auto', que mede a vazão de cada candidato numa amostra da população no início
+        de run() e escolhe o mais rápido. Por padrão, deriva de batched/optimized.
+
+    dtype : default=np.float64
+        Tipo dos genes da população (np.float32 reduz pela metade a memória da população, os checkpoints e as
+        cópias para os backends). Use o mesmo dtype no MultilayerPerceptron avaliado, para evitar conversões.
+
+    Após run(), stop_reason indica o motivo da parada: 'threshold', 'stagnation', 'diversity' ou 'max_iter'
+    (ou o retornado por after_evaluation), generations o número de gerações executadas e best_fitness a
+    aptidão do cromossomo retornado.
+
+    A população é um único array (pop_size, chromosome_size) e a reprodução de cada
+    geração (seleção, crossover, mutação e recorte em [-1, 1]) é feita com operações
+    de array sobre a geração inteira.
 
     Métodos:
     --------
-    run(threshold=9.5)
-        Executa o ciclo do algoritmo genético até atingir o número máximo de gerações ou um limiar de aptidão.
+    run(threshold=9.5, resume_from=None, after_evaluation=None)
+        Executa o ciclo do algoritmo genético até atingir o número máximo de gerações ou um limiar de aptidão,
+        opcionalmente continuando de um checkpoint.
 
     _evaluate_population()
         Avalia a aptidão de todos os cromossomos da população usando a fitness_function.
 
-    _mutate(chromosome, mutation_rate=0.05, learning_rate=0.1)
-        Aplica mutação gaussiana a cada gene do cromossomo com uma taxa de mutação.
+    _mutate(children)
+        Aplica mutação gaussiana, com uma taxa de mutação, aos genes de todos os filhos.
 
     _elitism()
         Retorna o melhor cromossomo da população e sua aptidão.
 
-    _select_parent()
-        Realiza seleção por torneio e retorna o índice de um dos pais.
+    _select_parents(n)
+        Realiza n seleções por torneio e retorna os índices dos pais.
 
-    _crossover(parent1, parent2)
-        Realiza o _crossover aritmético (média ponderada) entre dois cromossomos.
+    _crossover(parents1, parents2)
+        Realiza o crossover aritmético (média ponderada) entre pares de cromossomos.
 
-    _achieved_threshold(threshold=10, mode='max')
-        Verifica se a aptidão máxima ou média da população atingiu o limiar definido.
+    _achieved_threshold(threshold, chromosomes=None, scores=None)
+        Verifica se a aptidão máxima atingiu o limiar (confirmada pelo valor esperado exato, se a função for estocástica).
     """
 
-    def __init__(self, pop_size:int, chromosome_size:int, fitness_function, max_iter:int=100, learning_rate:float=0.1, mutation_rate:float=0.1, verbose:bool=False):
+    def __init__(self, pop_size:int, chromosome_size:int, fitness_function, max_iter:int=100, learning_rate:float=0.1, mutation_rate:float=0.1, verbose:bool=False, batched:bool=False,
+                 optimized:bool=True, n_workers:int|None=None, chunk_size:int|None=None, seed:int|None=None,
+                 cache_fitness:bool=True, checkpoint_path:str|None=None, checkpoint_every:int=1,
+                 async_checkpoint:bool=True, on_generation=None, patience:int|None=None, min_delta:float=0.0,
+                 min_diversity:float|None=None, screening_function=None, screening_keep:float=0.25,
+                 screening_scale:float|None=None, early_abort:bool=False, backend:str|Executor|None=None,
+                 dtype=np.float64):
         """
         Inicializa o algoritmo genético.
         """
@@ -56,75 +134,373 @@ class GeneticAlgorithm:
         self._verbose = verbose
         self._learning_rate = learning_rate
         self._mutation_rate = mutation_rate
+        if backend is None:
+            backend = 'batched' if batched else 'process' if optimized else 'serial'
+        self._backend = backend
+        self.backend_name = None
+        self._n_workers = n_workers
+        self._chunk_size = chunk_size
+        self._checkpoint_path = checkpoint_path
+        self._checkpoint_every = checkpoint_every
+        self._async_checkpoint = async_checkpoint
+        self._on_generation = on_generation
+        self._timer = PhaseTimer()
+        self._patience = patience
+        self._min_delta = min_delta
+        self._min_diversity = min_diversity
+        self._convergence = [float('-inf'), float('-inf'), 0]  # melhor max, melhor média, gerações sem melhora
+        self.stop_reason = None
+        self.generations = 0
+        self.best_fitness = None
+        self._screening_function = screening_function
+        self._screening_keep = screening_keep
+        if screening_function is not None and screening_scale is None:
+            if hasattr(fitness_function, 'max_score') and hasattr(screening_function, 'max_score'):
+                screening_scale = fitness_function.max_score() / screening_function.max_score()
+            else:
+                screening_scale = 1.0
+        self._screening_scale = screening_scale
+        self._n_screened = 0
+        self._early_abort = early_abort
+        self._has_scores = False
+        self._n_aborted = 0
         self._n_elite = self._pop_size // 3
+        self._rng = np.random.default_rng(seed)
+        self._dtype = np.dtype(dtype)
+
+        self._expected_scores = {}  # Aptidão esperada exata dos candidatos ao limiar (chave: bytes do cromossomo)
+
+        self._cache = None
+        if cache_fitness:
+            is_deterministic = getattr(fitness_function, 'is_deterministic', None)
+            self._cache = FitnessCache(deterministic=bool(is_deterministic and is_deterministic()))
 
         # Inicializa a população com valores aleatórios entre -1 e 1
-        self._population = [np.random.uniform(-1, 1, self._chromosome_size).tolist() for _ in range(self._pop_size)]
-        self._fitness_scores = [0.0 for _ in range(self._pop_size)]
+        self._population = self._rng.uniform(-1, 1, (self._pop_size, self._chromosome_size)).astype(self._dtype, copy=False)
+        self._fitness_scores = np.zeros(self._pop_size)
 
-    def run(self, threshold:float=5000) -> list[float]:
+    def run(self, threshold:float=5000, resume_from:str|None=None, after_evaluation=None) -> np.ndarray:
         """
         Executa o ciclo do algoritmo genético até atingir o número máximo de gerações ou o limiar de aptidão.
+
+        Com resume_from, restaura o checkpoint e continua da geração seguinte à gravada. Com avaliação
+        serial ou em lote, a continuação é idêntica bit a bit a uma execução sem interrupção.
+
+        after_evaluation(generation), se dado, é chamado em cada geração logo após a avaliação, antes da
+        seleção (ex.: migração do modelo de ilhas). Se retornar um motivo de parada, o treinamento
+        encerra ao fim da geração com esse motivo.
         """
-        for gen in range(0, self._max_iter):
-            print(f"\n{'='*10} Geração {gen} {'='*10}")
+        start_gen = 0
+        self.stop_reason = 'max_iter'
+        if resume_from is not None:
+            start_gen, self._elites, self._elite_scores = self._restore_checkpoint(resume_from)
 
-            self._evaluate_population()
+        self.generations = start_gen
+        with self._open_pool() as pool, ThreadPoolExecutor(max_workers=1) as writer:
+            self._writer, self._pending_write = writer, None
+            for gen in range(start_gen, self._max_iter):
+                self.generations = gen + 1
+                stop_reason = self._generation(gen, pool, threshold, after_evaluation)
+                if stop_reason:
+                    self.stop_reason = stop_reason
+                    if self._verbose:
+                        print(f"GeneticAlgorithm : Parada antecipada : Motivo={stop_reason} : Geração={gen} : Fitness={self._elite_scores[0]:.2f}")
+                    break
 
-            elites, elite_scores = self._elitism_list()
-            print(f'{elite_scores=}')
-            new_population = elites.copy()
+            if self._pending_write is not None:
+                self._pending_write.result()
+            self._writer = self._pending_write = None
 
-            for _ in elites:
-                p1 = new_population[random.randint(0, len(new_population) - 1)]
-                p2 = new_population[random.randint(0, len(new_population) - 1)]
-                child = self._crossover(p1, p2)
-                self._mutate(child)
-                new_population.append(child)
+        self.best_fitness = float(self._elite_scores[0])
+        print(f"GeneticAlgorithm : Treinamento concluído! Fitness={self.best_fitness:.2f} : Motivo={self.stop_reason}")
+        if self._verbose and self._cache is not None:
+            print(f"GeneticAlgorithm : Cache de aptidão : {self.cache_stats()}")
+        return self._elites[0].copy()
 
-            while len(new_population) < self._pop_size:
-                p1 = self._population[self._select_parent()]
-                p2 = self._population[self._select_parent()]
-                child = self._crossover(p1, p2)
-                self._mutate(child)
-                new_population.append(child)
+    def _generation(self, gen:int, pool, threshold:float, after_evaluation=None) -> str | None:
+        """
+        Executa uma geração: avaliação, hook after_evaluation, seleção e reprodução, critérios de parada,
+        checkpoint e métricas. Retorna o motivo de parada, ou None para continuar.
+        """
+        self._timer.reset()
+        gen_start = time.perf_counter()
+
+        n_evaluations = self._evaluate_population(pool)
+        hook_reason = after_evaluation(gen) if after_evaluation is not None else None
+
+        with self._timer('selection'):
+            self._elites, self._elite_scores = self._elitism_list()
+        self._population = self._reproduce(self._elites)
 
-            self._population = new_population
+        diversity = self._diversity()
+        stop_reason = self._stop_reason(threshold, diversity) or hook_reason
+        if self._checkpoint_path and (stop_reason or (gen + 1) % self._checkpoint_every == 0 or gen + 1 == self._max_iter):
+            with self._timer('checkpoint'):
+                self._pending_write = self._write_checkpoint(gen + 1, self._elites[0], self._elite_scores[0],
+                                                             self._writer, self._pending_write)
 
-            if self._achieved_threshold(threshold=threshold):
-                if self._verbose:
-                    print(f"GeneticAlgorithm : Atingiu a aptidão desejada : Geração={gen} : Fitness={elite_scores[0]:.2f}")
-                break
+        self._emit_metrics(gen, n_evaluations, time.perf_counter() - gen_start, diversity)
+        return stop_reason
 
-        print(f"GeneticAlgorithm : Treinamento concluído! Fitness={elite_scores[0]:.2f}")
-        return elites[0]
+    def _diversity(self) -> float:
+        """
+        Diversidade da população: desvio padrão médio de cada gene entre os indivíduos.
+        """
+        return float(self._population.std(axis=0).mean())
 
-    def _evaluate_population(self, optimized:bool=True) -> None:
+    def _stop_reason(self, threshold:float, diversity:float) -> str | None:
         """
-        Avalia a aptidão de cada cromossomo da população usando a fitness_function.
+        Verifica os critérios de parada antecipada e atualiza o histórico de convergência.
         """
-        if optimized:
-            with Pool() as pool:
-                self._fitness_scores = pool.map(self._fitness_function, self._population)
-            print(f'{self._fitness_scores=}')
+        if self._achieved_threshold(threshold, self._elites, self._elite_scores):
+            return 'threshold'
+
+        best_max, best_mean, stale = self._convergence
+        current_max, current_mean = float(self._fitness_scores.max()), float(self._fitness_scores.mean())
+        if current_max > best_max + self._min_delta or current_mean > best_mean + self._min_delta:
+            stale = 0
         else:
-            for i, chromosome in enumerate(self._population):
-                self._fitness_scores[i] = self._fitness_function(chromosome)
+            stale += 1
+        self._convergence = [max(best_max, current_max), max(best_mean, current_mean), stale]
+
+        if self._patience is not None and stale >= self._patience:
+            return 'stagnation'
+        if self._min_diversity is not None and diversity < self._min_diversity:
+            return 'diversity'
+        return None
+
+    def _emit_metrics(self, generation:int, n_evaluations:int, total_seconds:float, diversity:float) -> None:
+        """
+        Monta o evento da geração e o entrega ao callback on_generation (e ao log, se verbose).
+        """
+        if self._on_generation is None and not self._verbose:
+            return
 
+        timings = dict(self._timer.seconds, total=total_seconds)
+        evaluation_seconds = timings['evaluation'] + timings['ipc']
+        metrics = {
+            "generation": generation,
+            "timings": timings,
+            "fitness": {
+                "max": float(self._fitness_scores.max()),
+                "mean": float(self._fitness_scores.mean()),
+                "std": float(self._fitness_scores.std()),
+                "min": float(self._fitness_scores.min()),
+            },
+            "diversity": diversity,
+            "evaluations": n_evaluations,
+            "screened": self._n_screened,
+            "aborted": self._n_aborted,
+            "evals_per_second": n_evaluations / evaluation_seconds if evaluation_seconds else 0.0,
+            "cache": self.cache_stats(),
+        }
         if self._verbose:
-            print(f"GeneticAlgorithm : Fitnesses={self._fitness_scores}")
-
-    def _elitism_list(self) -> tuple[list[list[float]], list[float]]:
-        # ordena índices por fitness decrescente
-        ranked = sorted(range(self._pop_size), key=lambda i: self._fitness_scores[i], reverse=True)
-        elites = [ self._population[i] for i in ranked[:self._n_elite] ]
-        elite_scores = [ self._fitness_scores[i] for i in ranked[:self._n_elite] ]
-        print(f'{elite_scores=}')
+            print(format_generation(metrics))
+        if self._on_generation is not None:
+            self._on_generation(metrics)
+
+    def _write_checkpoint(self, generation:int, best_chromosome:np.ndarray, best_fitness:float, writer:ThreadPoolExecutor, pending_write):
+        """
+        Grava o estado atual. No modo assíncrono, a cópia do estado é feita aqui e a escrita vai para a thread
+        writer; erros da escrita anterior são propagados antes de agendar a próxima.
+        """
+        state = {
+            "generation": generation,
+            "population": self._population.copy(),
+            "fitness_scores": self._fitness_scores.copy(),
+            "best_chromosome": best_chromosome.copy(),
+            "best_fitness": best_fitness,
+            "rng": self._rng.bit_generator.state,
+            "global_rngs": rng_states(),
+            "convergence": self._convergence,
+        }
+        if self._cache is not None:
+            state.update(self._cache.state())
+
+        if pending_write is not None:
+            pending_write.result()
+        if not self._async_checkpoint:
+            save_checkpoint(self._checkpoint_path, state)
+            return None
+        return writer.submit(save_checkpoint, self._checkpoint_path, state)
+
+    def _restore_checkpoint(self, path:str) -> tuple[int, np.ndarray, np.ndarray]:
+        """
+        Restaura população, aptidões, RNGs e cache. Retorna a próxima geração e o melhor indivíduo gravado.
+        """
+        state = load_checkpoint(path, json_fields=("rng", "global_rngs", "convergence"))
+        self._population = state["population"].astype(self._dtype, copy=False)
+        self._fitness_scores = state["fitness_scores"]
+        self._rng.bit_generator.state = state["rng"]
+        restore_rng_states(state["global_rngs"])
+        self._convergence = state["convergence"]
+        self._has_scores = True
+        if self._cache is not None and "cache_keys" in state:
+            self._cache.load_state(state)
+
         if self._verbose:
-            print(f"GeneticAlgorithm : Elites Fitnesses={elite_scores}")
+            print(f"GeneticAlgorithm : Retomando de {path} : Geração={int(state['generation'])}")
+        return int(state["generation"]), state["best_chromosome"][None, :], np.array([state["best_fitness"]])
+
+    def cache_stats(self) -> dict | None:
+        """
+        Estatísticas do cache de aptidão (avaliações feitas e economizadas), ou None se desativado.
+        """
+        return self._cache.stats() if self._cache is not None else None
+
+    def _reproduce(self, elites:np.ndarray) -> np.ndarray:
+        """
+        Gera a próxima geração: as elites, filhos de pares de elites e filhos de pais
+        escolhidos por torneio na população inteira.
+        """
+        n_elite = len(elites)
+        n_rest = self._pop_size - 2 * n_elite
+
+        with self._timer('selection'):
+            elite_parents = self._rng.integers(0, n_elite, size=(2, n_elite))
+            parents = self._select_parents(2 * n_rest)
+
+        with self._timer('crossover'):
+            elite_children = self._crossover(elites[elite_parents[0]], elites[elite_parents[1]])
+            children = self._crossover(self._population[parents[:n_rest]], self._population[parents[n_rest:]])
+            children = np.concatenate([elite_children, children])
+
+        with self._timer('mutation'):
+            self._mutate(children)
+        return np.concatenate([elites, children])
+
+    def _fitness_functions(self) -> tuple:
+        return (self._fitness_function,) if self._screening_function is None else (self._fitness_function, self._screening_function)
+
+    def _open_pool(self):
+        """
+        Cria o backend de avaliação usado por run() (com backend='auto', escolhe-o por calibração).
+        """
+        backend = self._backend
+        if backend == 'auto':
+            backend, throughput = calibrate(self._fitness_functions(), self._population, self._n_workers, self._chunk_size)
+            if self._verbose:
+                rates = ' '.join(f"{name}={rate:.0f}/s" for name, rate in throughput.items())
+                print(f"GeneticAlgorithm : Calibração do backend : {rates} : Escolhido={backend}")
+        self.backend_name = backend if isinstance(backend, str) else getattr(backend, 'name', 'executor')
+        return create_backend(backend, self._fitness_functions(), (self._pop_size, self._chromosome_size),
+                              self._n_workers, self._chunk_size, self._dtype)
+
+    def _local_backend(self):
+        """
+        Backend no próprio processo (serial ou em lote), usado quando a avaliação é chamada fora de run(),
+        sem pool aberto. Dentro de run() (inclusive nas ilhas), o backend configurado é aberto por _open_pool().
+        """
+        return create_backend('batched' if self._backend == 'batched' else 'serial', self._fitness_functions(),
+                              (self._pop_size, self._chromosome_size))
+
+    def _evaluate_population(self, pool=None) -> int:
+        """
+        Avalia a aptidão de cada cromossomo da população usando a fitness_function
+        (em duas etapas, se houver screening_function).
+
+        Retorna o número de avaliações completas efetivamente executadas (descontando acertos do cache).
+        """
+        n_evaluations = 0
+        self._n_screened = 0
+        pool = pool if pool is not None else self._local_backend()
+        ipc_start = pool.ipc_seconds
+        aborted_start = getattr(pool, 'aborted', 0)
+        cutoff = self._cutoff(pool)
+
+        def evaluate(population):
+            nonlocal n_evaluations
+            n_evaluations += len(population)
+            return self._evaluate(population, pool, cutoff=cutoff)
+
+        with self._timer('evaluation'):
+            if self._screening_function is not None:
+                self._fitness_scores = self._evaluate_staged(evaluate, pool, cutoff)
+            elif self._cache is not None:
+                self._fitness_scores = self._cache.evaluate(self._population, evaluate, cutoff)
+            else:
+                self._fitness_scores = evaluate(self._population)
+        self._has_scores = True
+        self._n_aborted = getattr(pool, 'aborted', 0) - aborted_start  # Interrupções informadas pela fitness_function
+
+        # O tempo de cópia de/para a memória compartilhada é contado como IPC, não como avaliação
+        ipc_seconds = pool.ipc_seconds - ipc_start
+        self._timer.seconds['evaluation'] -= ipc_seconds
+        self._timer.seconds['ipc'] += ipc_seconds
+        return n_evaluations
+
+    def _cutoff(self, pool) -> float | None:
+        """
+        Corte da avaliação antecipada: a aptidão do pior elite da geração anterior (None se desativado
+        ou se o backend não repassa o corte).
+        """
+        if not self._early_abort or not pool.supports_cutoff or not self._has_scores:
+            return None
+        return float(np.sort(self._fitness_scores)[-self._n_elite])
+
+    def _evaluate_staged(self, evaluate, pool, cutoff:float|None=None) -> np.ndarray:
+        """
+        Avaliação em duas etapas (successive halving): triagem barata para todos, pipeline completo
+        apenas para os melhores da triagem e para quem já tem aptidão no cache.
+        """
+        known = self._cache.lookup(self._population) if self._cache is not None else np.full(len(self._population), np.nan)
+        unknown = np.flatnonzero(np.isnan(known))
+
+        screening = self._evaluate(self._population[unknown], pool, function_index=1)
+        self._n_screened = len(unknown)
+
+        n_keep = int(np.ceil(self._screening_keep * len(unknown)))
+        ranked = np.argsort(-screening, kind='stable')
+        survivors = np.sort(np.concatenate([np.flatnonzero(~np.isnan(known)), unknown[ranked[:n_keep]]]))
+        pruned = unknown[ranked[n_keep:]]
+
+        scores = np.empty(len(self._population))
+        if self._cache is not None:
+            scores[survivors] = self._cache.evaluate(self._population[survivors], evaluate, cutoff)
+        else:
+            scores[survivors] = evaluate(self._population[survivors])
+
+        # Estimativa limitada dos podados: nunca acima do pior sobrevivente
+        floor = scores[survivors].min() if len(survivors) else np.inf
+        scores[pruned] = np.minimum(self._screening_scale * screening[ranked[n_keep:]], floor)
+        return scores
+
+    def _evaluate(self, population:np.ndarray, pool, function_index:int=0, cutoff:float|None=None) -> np.ndarray:
+        """
+        Avalia um conjunto de cromossomos (linhas) pelo backend aberto.
+
+        function_index 0 usa a fitness_function e 1 a screening_function. O cutoff, se dado, é repassado
+        à função (fitness_function(chromosome, cutoff)).
+        """
+        if not len(population):
+            return np.empty(0)
+        return pool.evaluate(population, function_index, cutoff)
+
+    def _elitism_list(self) -> tuple[np.ndarray, np.ndarray]:
+        # ordena índices por fitness decrescente (estável, empates mantêm a ordem da população)
+        ranked = np.argsort(-self._fitness_scores, kind='stable')[:self._n_elite]
+        elites = self._population[ranked]
+        elite_scores = self._fitness_scores[ranked]
         return elites, elite_scores
 
-    def _elitism(self) -> tuple[list[float], float]:
+    def _migrants(self, n:int) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Cópia dos n melhores cromossomos avaliados e de suas aptidões (emigrantes do modelo de ilhas).
+        """
+        ranked = np.argsort(-self._fitness_scores, kind='stable')[:n]
+        return self._population[ranked].copy(), self._fitness_scores[ranked].copy()
+
+    def _immigrate(self, chromosomes:np.ndarray, scores:np.ndarray) -> None:
+        """
+        Substitui os piores indivíduos avaliados pelos imigrantes, já com suas aptidões.
+        """
+        if not len(chromosomes):
+            return
+        worst = np.argsort(self._fitness_scores, kind='stable')[:len(chromosomes)]
+        self._population[worst] = chromosomes
+        self._fitness_scores[worst] = scores
+
+    def _elitism(self) -> tuple[np.ndarray, float]:
         """
         Retorna o melhor cromossomo da população e sua aptidão.
         """
@@ -138,38 +514,53 @@ class GeneticAlgorithm:
             print(f"GeneticAlgorithm : Best Fitness={best_fitness:.2f}")
         return best_chromosome, best_fitness
 
-    def _select_parent(self) -> int:
+    def _select_parents(self, n:int) -> np.ndarray:
         """
-        Seleciona um cromossomo por torneio: escolhe dois aleatórios e retorna o melhor.
+        Seleciona n cromossomos por torneio: para cada um, sorteia dois distintos e retorna o índice do melhor.
         """
-        parent1, parent2 = random.sample(range(len(self._population)), 2)
+        first = self._rng.integers(0, self._pop_size, size=n)
+        second = (first + self._rng.integers(1, self._pop_size, size=n)) % self._pop_size
 
-        return parent1 if self._fitness_scores[parent1] > self._fitness_scores[parent2] else parent2
+        return np.where(self._fitness_scores[first] > self._fitness_scores[second], first, second)
 
-    def _crossover(self, parent1, parent2) -> list[float]:
+    def _crossover(self, parents1:np.ndarray, parents2:np.ndarray) -> np.ndarray:
         """
-        Realiza crossover aritmético entre dois cromossomos, gerando um novo filho.
+        Realiza crossover aritmético entre pares de cromossomos (linhas), gerando um filho por par.
         """
-        a = random.uniform(0, 1)
-        return [a * p1 + (1 - a) * p2 for p1, p2 in zip(parent1, parent2)]
+        a = self._rng.uniform(0, 1, size=(len(parents1), 1)).astype(parents1.dtype, copy=False)
+        return a * parents1 + (1 - a) * parents2
 
-    def _mutate(self, chromosome:list[float]) -> None:
+    def _mutate(self, children:np.ndarray) -> None:
         """
-        Aplica mutação gaussiana em cada gene do cromossomo com uma certa taxa de mutação.
+        Aplica mutação gaussiana nos genes dos filhos com uma certa taxa de mutação (no próprio array).
         """
-        for i in range(len(chromosome)):
-            if random.random() < self._mutation_rate:
-                if random.random() < 0.5:
-                    chromosome[i] += np.random.normal(0, self._learning_rate)
-                else:
-                    chromosome[i] -= np.random.normal(0, self._learning_rate)
-                chromosome[i] = max(min(chromosome[i], 1), -1)  # Mantém os valores no intervalo [-1, 1]
+        mask = self._rng.random(children.shape) < self._mutation_rate
+        children[mask] += self._rng.normal(0, self._learning_rate, size=int(mask.sum()))
+        np.clip(children, -1, 1, out=children)  # Mantém os valores no intervalo [-1, 1]
 
-    def _achieved_threshold(self, threshold:int) -> bool:
+    def _achieved_threshold(self, threshold:float, chromosomes:np.ndarray|None=None, scores:np.ndarray|None=None) -> bool:
         """
         Verifica se a aptidão da população atingiu o limiar definido.
+
+        Com uma fitness_function estocástica que oferece expected_score() (ex.: FitnessEvaluator), uma amostra
+        acima do limiar pode ser sorte: só conta se o valor esperado exato do cromossomo também o atingir.
         Parâmetros:
             threshold: valor mínimo de aptidão para considerar como atingido.
-            mode: 'max' para considerar o melhor cromossomo, 'avg' para considerar a média da população.
+            chromosomes, scores: cromossomos avaliados e suas aptidões. Por padrão, a população atual.
         """
-        return max(self._fitness_scores) >= threshold
+        chromosomes = self._population if chromosomes is None else chromosomes
+        scores = self._fitness_scores if scores is None else scores
+        if scores.max() < threshold:
+            return False
+
+        is_deterministic = getattr(self._fitness_function, 'is_deterministic', None)
+        if not hasattr(self._fitness_function, 'expected_score') or (is_deterministic and is_deterministic()):
+            return True
+        for i in np.flatnonzero(scores >= threshold):
+            key = chromosomes[i].tobytes()
+            if key not in self._expected_scores:
+                self._expected_scores[key] = self._fitness_function.expected_score(chromosomes[i])
+            expected = self._expected_scores[key]
+            if expected is None or expected >= threshold:
+                return True
+        return False
@@ -0,0 +1,238 @@
+import queue
+import random
+import numpy as np
+import multiprocessing as mp
+from collections import deque
+
+from .genetic_algorithm import GeneticAlgorithm
+
+TOPOLOGIES = ('ring', 'all')
+
+
+def _destinations(index: int, n_islands: int, topology: str) -> list[int]:
+    """
+    Ilhas que recebem os emigrantes da ilha index.
+    """
+    if n_islands == 1:
+        return []
+    if topology == 'ring':
+        return [(index + 1) % n_islands]
+    return [i for i in range(n_islands) if i != index]
+
+
+def _sources(index: int, n_islands: int, topology: str) -> list[int]:
+    """
+    Ilhas das quais a ilha index recebe imigrantes.
+    """
+    return [i for i in range(n_islands) if index in _destinations(i, n_islands, topology)]
+
+
+def _receive(inbox, sources: set[int], pending: dict[int, deque], stop) -> list[tuple[np.ndarray, np.ndarray]]:
+    """
+    Espera uma leva de imigrantes de cada ilha de origem ainda ativa. Mensagens de épocas futuras ficam
+    em pending; uma origem que encerrou (mensagem None) deixa de ser esperada.
+    """
+    migrants = []
+    waiting = set(sources)
+    for source in list(waiting):
+        if pending[source]:
+            migrants.append(pending[source].popleft())
+            waiting.discard(source)
+
+    while waiting and not stop.is_set():
+        try:
+            source, payload = inbox.get(timeout=0.1)
+        except queue.Empty:  # Verifica a parada global e volta a esperar
+            continue
+        if payload is None:
+            sources.discard(source)
+            waiting.discard(source)
+        elif source in waiting:
+            migrants.append(payload)
+            waiting.discard(source)
+        else:
+            pending[source].append(payload)
+    return migrants
+
+
+def _run_island(index: int, config: dict, inboxes: list, events, stop) -> None:
+    """
+    Processo de uma ilha: evolui a subpopulação com GeneticAlgorithm.run() e troca migrantes com as
+    vizinhas (hook after_evaluation) a cada migration_interval gerações, sem barreira global.
+    """
+    seed = config['seeds'][index]
+    random.seed(int(seed.generate_state(1)[0]))
+    np.random.seed(seed.generate_state(1)[0])
+
+    ga = GeneticAlgorithm(
+        pop_size=config['island_size'],
+        chromosome_size=config['chromosome_size'],
+        fitness_function=config['fitness_function'],
+        max_iter=config['max_iter'],
+        optimized=False,
+        seed=seed,
+        on_generation=(lambda metrics: events.put(('generation', index, metrics))) if config['report'] else None,
+        **config['ga_options']
+    )
+    n_islands, topology = config['n_islands'], config['topology']
+    destinations = _destinations(index, n_islands, topology)
+    sources = set(_sources(index, n_islands, topology))
+    pending = {source: deque() for source in sources}
+
+    def migrate(gen: int) -> str | None:
+        """
+        Migração após a avaliação: os melhores seguem para as vizinhas e os imigrantes substituem os piores locais.
+        """
+        if stop.is_set():
+            return 'interrupted'  # Outra ilha atingiu o limiar
+        if (gen + 1) % config['migration_interval'] == 0 and gen + 1 < config['max_iter']:
+            emigrants = ga._migrants(config['n_migrants'])
+            for destination in destinations:
+                inboxes[destination].put((index, emigrants))
+            for chromosomes, scores in _receive(inboxes[index], sources, pending, stop):
+                ga._immigrate(chromosomes, scores)
+        return None
+
+    best_chromosome = ga.run(threshold=config['threshold'], after_evaluation=migrate)
+    if ga.stop_reason == 'threshold':
+        stop.set()
+
+    # Avisa as vizinhas para não esperarem mais migrantes desta ilha
+    for destination in destinations:
+        inboxes[destination].put((index, None))
+    events.put(('done', index, {
+        "best_chromosome": best_chromosome,
+        "best_fitness": ga.best_fitness,
+        "stop_reason": ga.stop_reason,
+        "generations": ga.generations,
+    }))
+    for inbox in inboxes:
+        inbox.cancel_join_thread()  # Migrantes não consumidos podem ser descartados ao sair
+
+
+class IslandModel:
+    """
+    Modelo de ilhas: n_islands processos, cada um dono de uma subpopulação (island_size) que evolui
+    localmente com um GeneticAlgorithm próprio (seleção, elitismo e reprodução locais). A cada
+    migration_interval gerações, cada ilha envia cópias dos seus n_migrants melhores indivíduos para
+    as vizinhas, que os colocam no lugar dos seus piores.
+
+    Não há barreira global por geração nem troca da população inteira: cada ilha só espera os
+    migrantes das suas vizinhas, e apenas nas gerações de migração.
+
+    Parâmetros:
+    -----------
+    n_islands : int
+        Número de ilhas (processos). Por padrão, os.cpu_count().
+    island_size : int
+        Tamanho da subpopulação de cada ilha.
+    chromosome_size : int
+        Número de genes (pesos) em cada cromossomo.
+    fitness_function : function
+        Função de aptidão (precisa ser serializável com pickle, como o FitnessEvaluator).
+    max_iter : int, default=100
+        Número máximo de gerações de cada ilha.
+    migration_interval : int, default=5
+        Gerações entre migrações.
+    n_migrants : int, default=2
+        Indivíduos enviados por ilha em cada migração.
+    topology : str, default='ring'
+        'ring' (cada ilha envia para a seguinte) ou 'all' (cada ilha envia para todas as outras).
+    seed : int, opcional
+        Semente da qual derivam sementes independentes para cada ilha.
+    on_generation : function, opcional
+        Recebe as métricas de cada geração de cada ilha (mesmo dict do GeneticAlgorithm, com a chave 'island').
+    **ga_options
+        Demais parâmetros do GeneticAlgorithm de cada ilha (learning_rate, mutation_rate, batched,
+        cache_fitness, patience...). Cada ilha abre o próprio backend ('serial', 'batched' ou 'thread')
+        durante o run() do seu GeneticAlgorithm.
+
+    Após run(), stop_reason indica o motivo da parada ('threshold' se alguma ilha atingiu o limiar)
+    e islands traz o resultado de cada ilha.
+    """
+
+    def __init__(self, n_islands: int | None, island_size: int, chromosome_size: int, fitness_function,
+                 max_iter: int = 100, migration_interval: int = 5, n_migrants: int = 2, topology: str = 'ring',
+                 seed: int | None = None, on_generation=None, **ga_options):
+        if topology not in TOPOLOGIES:
+            raise ValueError(f"IslandModel : Topologia desconhecida: {topology} (esperado uma de {TOPOLOGIES})")
+        if migration_interval < 1:
+            raise ValueError(f"IslandModel : migration_interval deve ser >= 1, recebeu {migration_interval}")
+        backend = ga_options.get('backend')
+        if backend is not None and not isinstance(backend, str):
+            raise ValueError("IslandModel : Executores e objetos backend não são enviados às ilhas; use backend 'serial', 'batched' ou 'thread'")
+        if backend in ('process', 'auto'):
+            raise ValueError("IslandModel : Cada ilha já é um processo; use backend 'serial', 'batched' ou 'thread'")
+        for option in ('optimized', 'n_workers', 'chunk_size', 'checkpoint_path', 'on_generation'):
+            if option in ga_options:
+                raise ValueError(f"IslandModel : Opção não suportada nas ilhas: {option}")
+
+        self._n_islands = n_islands or mp.cpu_count()
+        self._island_size = island_size
+        self._chromosome_size = chromosome_size
+        self._fitness_function = fitness_function
+        self._max_iter = max_iter
+        self._migration_interval = migration_interval
+        self._n_migrants = min(n_migrants, island_size)
+        self._topology = topology
+        self._seed = seed
+        self._on_generation = on_generation
+        self._ga_options = ga_options
+        self.stop_reason = None
+        self.islands = []
+
+    def run(self, threshold: float = 5000) -> np.ndarray:
+        """
+        Evolui todas as ilhas até o máximo de gerações (ou até uma delas atingir o limiar)
+        e retorna o melhor cromossomo encontrado.
+        """
+        config = {
+            "n_islands": self._n_islands,
+            "island_size": self._island_size,
+            "chromosome_size": self._chromosome_size,
+            "fitness_function": self._fitness_function,
+            "max_iter": self._max_iter,
+            "migration_interval": self._migration_interval,
+            "n_migrants": self._n_migrants,
+            "topology": self._topology,
+            "threshold": threshold,
+            "seeds": np.random.SeedSequence(self._seed).spawn(self._n_islands),
+            "report": self._on_generation is not None,
+            "ga_options": self._ga_options,
+        }
+        inboxes = [mp.Queue() for _ in range(self._n_islands)]
+        events = mp.Queue()
+        stop = mp.Event()
+        processes = [
+            mp.Process(target=_run_island, args=(i, config, inboxes, events, stop), daemon=True)
+            for i in range(self._n_islands)
+        ]
+        for process in processes:
+            process.start()
+
+        results = [None] * self._n_islands
+        try:
+            while any(result is None for result in results):
+                try:
+                    kind, index, payload = events.get(timeout=1)
+                except queue.Empty:
+                    crashed = [i for i, p in enumerate(processes) if results[i] is None and p.exitcode not in (None, 0)]
+                    if crashed:
+                        raise RuntimeError(f"IslandModel : Ilhas {crashed} encerraram com erro")
+                    continue
+                if kind == 'generation':
+                    self._on_generation(dict(payload, island=index))
+                else:
+                    results[index] = payload
+        finally:
+            for process in processes:
+                process.join(timeout=1)
+                if process.is_alive():
+                    process.terminate()
+
+        self.islands = results
+        best = max(results, key=lambda result: result['best_fitness'])
+        reasons = {result['stop_reason'] for result in results}
+        self.stop_reason = 'threshold' if 'threshold' in reasons else best['stop_reason']
+        print(f"IslandModel : Treinamento concluído! Fitness={best['best_fitness']:.2f} : Motivo={self.stop_reason}")
+        return best['best_chromosome']
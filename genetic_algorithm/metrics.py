@@ -0,0 +1,56 @@
+import time
+from contextlib import contextmanager
+
+PHASES = ('evaluation', 'ipc', 'selection', 'crossover', 'mutation', 'checkpoint')
+
+
+class PhaseTimer:
+    """
+    Acumula o tempo de parede de cada fase de uma geração (perf_counter).
+    """
+
+    def __init__(self):
+        self.reset()
+
+    def reset(self) -> None:
+        self.seconds = dict.fromkeys(PHASES, 0.0)
+
+    @contextmanager
+    def __call__(self, phase: str):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.seconds[phase] += time.perf_counter() - start
+
+
+def format_generation(metrics: dict) -> str:
+    """
+    Formata o evento de uma geração (ou o relatório do SteadyStateGA) numa única linha de log.
+    """
+    fitness = metrics['fitness']
+    if 'generation' not in metrics:
+        return (f"SteadyStateGA : Avaliações={metrics['evaluations']} : "
+                f"Fitness max={fitness['max']:.2f} mean={fitness['mean']:.2f} std={fitness['std']:.2f} : "
+                f"Diversidade={metrics['diversity']:.4f} : Substituições={metrics['replacements']} : "
+                f"{metrics['evals_per_second']:.0f} avaliações/s")
+    timings = ' '.join(f"{phase}={seconds * 1e3:.1f}ms" for phase, seconds in metrics['timings'].items())
+    island = f"Ilha={metrics['island']} : " if 'island' in metrics else ""
+    line = (f"GeneticAlgorithm : {island}Geração={metrics['generation']} : "
+            f"Fitness max={fitness['max']:.2f} mean={fitness['mean']:.2f} std={fitness['std']:.2f} : "
+            f"Diversidade={metrics['diversity']:.4f} : "
+            f"{metrics['evaluations']} avaliações ({metrics['evals_per_second']:.0f}/s) : {timings}")
+    if metrics.get('screened'):
+        line += f" : triados={metrics['screened']}"
+    if metrics.get('aborted'):
+        line += f" : interrompidos={metrics['aborted']}"
+    if metrics.get('cache') is not None:
+        line += f" : cache hit_rate={metrics['cache']['hit_rate']:.1%}"
+    return line
+
+
+def print_generation(metrics: dict) -> None:
+    """
+    Callback on_generation simples, que imprime uma linha por geração.
+    """
+    print(format_generation(metrics))
@@ -0,0 +1,150 @@
+import os
+import time
+import numpy as np
+from concurrent.futures import ProcessPoolExecutor, wait, FIRST_COMPLETED
+
+from .genetic_algorithm import GeneticAlgorithm
+from .metrics import format_generation
+from ._shared_pool import _worker, _init_functions
+
+# Opções do GeneticAlgorithm sem efeito no modo assíncrono (avaliação sempre no pool de processos próprio,
+# sem cache, triagem, corte, checkpoints nem critérios de convergência por geração).
+UNSUPPORTED_OPTIONS = ('batched', 'optimized', 'backend', 'chunk_size', 'cache_fitness', 'checkpoint_path',
+                       'checkpoint_every', 'async_checkpoint', 'patience', 'min_delta', 'min_diversity',
+                       'screening_function', 'screening_keep', 'screening_scale', 'early_abort')
+
+
+def _evaluate(chromosome: np.ndarray) -> float:
+    return float(_worker['fitness_functions'][0](chromosome))
+
+
+class SteadyStateGA(GeneticAlgorithm):
+    """
+    Evolução assíncrona em regime permanente (steady-state), sem barreira de geração.
+
+    Os n_workers processos mantêm sempre tarefas em andamento: assim que uma avaliação termina,
+    o filho avaliado substitui o pior indivíduo da população (se for melhor que ele), dois pais
+    são escolhidos por torneio na população atual e um novo filho (crossover + mutação) é
+    enviado para avaliação. Partidas rápidas e lentas deixam de esperar umas pelas outras.
+
+    Usa os mesmos operadores e parâmetros do GeneticAlgorithm (max_iter, learning_rate, mutation_rate,
+    n_workers, seed, on_generation, verbose, dtype); as demais opções (UNSUPPORTED_OPTIONS: backend, cache,
+    triagem, corte, checkpoints, patience...) são rejeitadas. A ordem de conclusão das tarefas varia entre execuções,
+    então o resultado não é reprodutível bit a bit mesmo com seed.
+
+    Parâmetros adicionais:
+    ----------------------
+    max_evaluations : int, opcional
+        Número máximo de avaliações. Por padrão, max_iter * pop_size (o mesmo orçamento do modo por gerações).
+    report_every : int, opcional
+        Intervalo, em avaliações concluídas, entre relatórios para on_generation. Por padrão, pop_size.
+    in_flight : int, opcional
+        Filhos em avaliação ao mesmo tempo. Por padrão, 2 * n_workers.
+
+    O relatório entregue a on_generation traz evaluations, elapsed, evals_per_second, replacements,
+    fitness (max, mean, std, min) e diversity.
+
+    Após run(), stop_reason indica o motivo da parada: 'threshold' ou 'max_evaluations'.
+    """
+
+    def __init__(self, pop_size:int, chromosome_size:int, fitness_function, max_evaluations:int|None=None,
+                 report_every:int|None=None, in_flight:int|None=None, **ga_options):
+        for option in UNSUPPORTED_OPTIONS:
+            if option in ga_options:
+                raise ValueError(f"SteadyStateGA : Opção não suportada no modo assíncrono: {option}")
+        super().__init__(pop_size, chromosome_size, fitness_function, cache_fitness=False, **ga_options)
+        self._n_workers = self._n_workers or os.cpu_count() or 1
+        self._max_evaluations = max_evaluations or self._max_iter * self._pop_size
+        self._report_every = report_every or self._pop_size
+        self._in_flight = in_flight or 2 * self._n_workers
+        self._fitness_scores = np.full(self._pop_size, -np.inf)
+        self._replacements = 0
+
+    def run(self, threshold:float=5000) -> np.ndarray:
+        """
+        Avalia a população inicial e segue gerando, avaliando e substituindo indivíduos um a um
+        até atingir o limiar ou max_evaluations.
+        """
+        self.stop_reason = 'max_evaluations'
+        self._replacements = 0
+        start = time.perf_counter()
+        evaluations = 0
+
+        with ProcessPoolExecutor(max_workers=self._n_workers, initializer=_init_functions,
+                                 initargs=((self._fitness_function,),)) as executor:
+            # População inicial: todas as avaliações de uma vez mantêm os processos ocupados
+            pending = {executor.submit(_evaluate, chromosome): i for i, chromosome in enumerate(self._population)}
+            while pending:
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    self._fitness_scores[pending.pop(future)] = future.result()
+                    evaluations += 1
+                    self._report(evaluations, start)
+
+            children = {}
+            while not self._achieved_threshold(threshold) and evaluations < self._max_evaluations:
+                # Mantém in_flight filhos em avaliação, sem ultrapassar o orçamento de avaliações
+                while len(children) < min(self._in_flight, self._max_evaluations - evaluations):
+                    child = self._breed()
+                    children[executor.submit(_evaluate, child)] = child
+
+                done, _ = wait(children, return_when=FIRST_COMPLETED)
+                for future in done:
+                    self._replace(children.pop(future), future.result())
+                    evaluations += 1
+                    self._report(evaluations, start)
+
+            for future in children:
+                future.cancel()
+
+        if self._achieved_threshold(threshold):
+            self.stop_reason = 'threshold'
+        best_chromosome, best_fitness = self._elitism()
+        print(f"SteadyStateGA : Treinamento concluído! Fitness={best_fitness:.2f} : Avaliações={evaluations} : Motivo={self.stop_reason}")
+        return best_chromosome.copy()
+
+    def _breed(self) -> np.ndarray:
+        """
+        Gera um filho de dois pais escolhidos por torneio na população atual.
+        """
+        parents = self._select_parents(2)
+        child = self._crossover(self._population[parents[:1]], self._population[parents[1:]])
+        self._mutate(child)
+        return child[0]
+
+    def _replace(self, child:np.ndarray, fitness:float) -> None:
+        """
+        Substitui o pior indivíduo pelo filho avaliado, se o filho for melhor.
+        """
+        worst = int(np.argmin(self._fitness_scores))
+        if fitness > self._fitness_scores[worst]:
+            self._population[worst] = child
+            self._fitness_scores[worst] = fitness
+            self._replacements += 1
+
+    def _report(self, evaluations:int, start:float) -> None:
+        """
+        Entrega o relatório a on_generation (e ao log, se verbose) a cada report_every avaliações.
+        """
+        if evaluations % self._report_every or (self._on_generation is None and not self._verbose):
+            return
+
+        elapsed = time.perf_counter() - start
+        evaluated = self._fitness_scores[np.isfinite(self._fitness_scores)]
+        metrics = {
+            "evaluations": evaluations,
+            "elapsed": elapsed,
+            "evals_per_second": evaluations / elapsed if elapsed else 0.0,
+            "replacements": self._replacements,
+            "fitness": {
+                "max": float(evaluated.max()),
+                "mean": float(evaluated.mean()),
+                "std": float(evaluated.std()),
+                "min": float(evaluated.min()),
+            },
+            "diversity": self._diversity(),
+        }
+        if self._verbose:
+            print(format_generation(metrics))
+        if self._on_generation is not None:
+            self._on_generation(metrics)
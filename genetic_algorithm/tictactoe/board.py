@@ -1,7 +1,23 @@
+# Máscaras de 9 bits (bit i = casa i) das 8 linhas vencedoras.
+_WIN_MASKS = (
+    0b000000111, 0b000111000, 0b111000000,
+    0b001001001, 0b010010010, 0b100100100,
+    0b100010001, 0b001010100
+)
+_FULL = 0b111111111
+
+# Tabela de 512 entradas: _WINS[mask] indica se o conjunto de casas contém uma linha completa.
+_WINS = tuple(any(mask & line == line for line in _WIN_MASKS) for mask in range(512))
+
+
 class Board:
     """
     Classe para gerenciar o estado de um tabuleiro de jogo da velha (Tic-Tac-Toe).
 
+    O estado é guardado como dois inteiros de 9 bits (um por jogador), e vitória,
+    empate e jogo em andamento saem de uma tabela pré-calculada de 512 entradas.
+    O atributo board continua disponível como lista 1x9 para a entrada da MLP.
+
     A lógica é baseada em:
     - X representado pelo valor 1 (MLP).
     - O representado pelo valor -1 (Minimax).
@@ -16,8 +32,11 @@ class Board:
 
     Métodos:
     --------
-    update_board(symbol: int, x: int, y: int) -> bool
-        Atualiza o tabuleiro com a jogada do jogador no ponto (x, y). Retorna True se a jogada for válida.
+    update_board(symbol: int, index: int) -> bool
+        Atualiza o tabuleiro com a jogada do jogador na casa index. Retorna True se a jogada for válida.
+
+    undo(index: int) -> None
+        Desfaz a jogada na casa index.
 
     flatten_board() -> list
         Retorna o tabuleiro como uma lista linear (1x9) para entrada da MLP.
@@ -30,9 +49,18 @@ class Board:
         """
         Inicializa o tabuleiro vazio (1x9).
         """
-        self.board = [0, 0, 0,
-                      0, 0, 0,
-                      0, 0, 0]
+        self._x = 0  # Casas ocupadas por X
+        self._o = 0  # Casas ocupadas por O
+        self._cells = [0, 0, 0,
+                       0, 0, 0,
+                       0, 0, 0]
+
+    @property
+    def board(self) -> list[int]:
+        """
+        Visão do tabuleiro como lista linear 1x9 (1 para X, -1 para O, 0 para vazio).
+        """
+        return self._cells
 
     def update_board(self, symbol: int, index: int) -> bool:
         """
@@ -49,10 +77,26 @@ class Board:
         --------
         bool : True se a jogada foi válida, False caso contrário.
         """
-        if self.board[index] == 0 and self.__valid_coordinates(index) and self.__valid_symbol(symbol):
-            self.board[index] = symbol
-            return True
-        return False
+        if not (self.__valid_coordinates(index) and self.__valid_symbol(symbol)):
+            return False
+        bit = 1 << index
+        if (self._x | self._o) & bit:
+            return False
+        if symbol == 1:
+            self._x |= bit
+        else:
+            self._o |= bit
+        self._cells[index] = symbol
+        return True
+
+    def undo(self, index: int) -> None:
+        """
+        Desfaz a jogada feita na casa index.
+        """
+        bit = 1 << index
+        self._x &= ~bit
+        self._o &= ~bit
+        self._cells[index] = 0
 
     def check_win(self) -> int:
         """
@@ -66,24 +110,13 @@ class Board:
             1 : O venceu
             2 : Jogo em andamento
         """
-        b = self.board
-
-        for i in [0, 3, 6]:
-            if b[i] == b[i + 1] == b[i + 2] != 0:
-                return b[i]
-        for i in [0, 1, 2]:
-            if b[i] == b[i + 3] == b[i + 6] != 0:
-                return b[i]
-
-        # Verifica diagonais
-        if b[0] == b[4] == b[8] != 0:
-            return b[4]
-        if b[2] == b[4] == b[6] != 0:
-            return b[4]
-
-        if 0 in b:
-            return 2 # Em progesso
-        return 0 # Empate
+        if _WINS[self._x]:
+            return 1
+        if _WINS[self._o]:
+            return -1
+        if self._x | self._o == _FULL:
+            return 0 # Empate
+        return 2 # Em progesso
 
     def is_ongoing(self) -> bool:
         return self.check_win() == 2
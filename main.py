@@ -1,25 +1,89 @@
 import os
 import json
-from genetic_algorithm import GeneticAlgorithm, FitnessEvaluator
+import numpy as np
+from genetic_algorithm import GeneticAlgorithm, FitnessEvaluator, IslandModel, SteadyStateGA
+from genetic_algorithm.metrics import print_generation
 from model import MultilayerPerceptron, Minimax
 
 def train(learner: MultilayerPerceptron, trainer: Minimax, population_size: int, pipeline: list[str],
-          max_iter: int = 100, threshold: float = 500, learning_rate: float = 0.1, mutation_rate: float = 0.1,
-          verbose: bool = False) -> MultilayerPerceptron:
+          max_iter: int = 100, threshold: float | None = None, learning_rate: float = 0.1, mutation_rate: float = 0.1,
+          verbose: bool = False, batched: bool = False, checkpoint_path: str | None = None,
+          resume_from: str | None = None, on_generation=None, patience: int | None = None,
+          min_diversity: float | None = None, screening_pipeline: list[str] | None = None,
+          screening_keep: float = 0.25, early_abort: bool = False, islands: int | None = None,
+          migration_interval: int = 5, steady_state: bool = False, backend: str | None = None) -> MultilayerPerceptron:
 
     print(f"Main : Pipeline de dificuldades: Easy={pipeline.count('easy')} | Medium={pipeline.count('medium')} | Hard={pipeline.count('hard')}")
 
+    fitness_function = FitnessEvaluator(learner, trainer, pipeline, verbose)
+    if threshold is None:
+        threshold = fitness_function.achievable_score() # Ótimo esperado, confirmado pelo valor esperado exato (sem ruído)
+
+    # Triagem barata: só os melhores da triagem jogam o pipeline completo
+    screening_function = None
+    if screening_pipeline:
+        screening_function = FitnessEvaluator(learner, trainer, screening_pipeline, verbose)
+
+    if islands:
+        # Modelo de ilhas: cada processo evolui population_size // islands indivíduos e troca migrantes
+        training = IslandModel(
+            n_islands=islands,
+            island_size=population_size // islands,
+            chromosome_size=learner.count_weights(),
+            fitness_function=fitness_function,
+            max_iter=max_iter,
+            migration_interval=migration_interval,
+            on_generation=on_generation,
+            learning_rate=learning_rate,
+            mutation_rate=mutation_rate,
+            dtype=learner.get_dtype(),
+            verbose=verbose,
+            batched=batched,
+            patience=patience,
+            min_diversity=min_diversity,
+            screening_function=screening_function,
+            screening_keep=screening_keep
+        )
+        learner.update(training.run(threshold=threshold))
+        return learner
+
+    if steady_state:
+        # Evolução assíncrona: cada avaliação concluída já gera e envia um novo filho
+        training = SteadyStateGA(
+            pop_size=population_size,
+            chromosome_size=learner.count_weights(),
+            fitness_function=fitness_function,
+            max_iter=max_iter,
+            learning_rate=learning_rate,
+            mutation_rate=mutation_rate,
+            dtype=learner.get_dtype(),
+            verbose=verbose,
+            on_generation=on_generation
+        )
+        learner.update(training.run(threshold=threshold))
+        return learner
+
     training = GeneticAlgorithm(
         pop_size=population_size,
         chromosome_size=learner.count_weights(),
-        fitness_function=FitnessEvaluator(learner, trainer, pipeline, verbose),
+        fitness_function=fitness_function,
         max_iter=max_iter,
         learning_rate=learning_rate,
         mutation_rate=mutation_rate,
-        verbose=verbose
+        dtype=learner.get_dtype(), # População no mesmo tipo dos pesos da rede
+        verbose=verbose,
+        batched=batched,
+        backend=backend,
+        checkpoint_path=checkpoint_path,
+        on_generation=on_generation,
+        patience=patience,
+        min_diversity=min_diversity,
+        screening_function=screening_function,
+        screening_keep=screening_keep,
+        early_abort=early_abort
     )
 
-    best_chromosomes = training.run(threshold=threshold)
+    best_chromosomes = training.run(threshold=threshold, resume_from=resume_from)
     learner.update(best_chromosomes)
     return learner
 
@@ -33,11 +97,21 @@ if __name__ == '__main__':
         8 * ['hard']
     )
 
-    TOPOLOGY = [9, 32, 9]
+    SCREENING_PIPELINE = ['hard'] # Triagem determinística de uma partida
+
+    TOPOLOGY = [9, 32, 9] # Ex.: [9, 128, 9], viável com DTYPE = np.float32
+    DTYPE = np.float32 # Pesos e população em precisão simples: metade da memória e das cópias entre processos
 
     VERBOSE = False
+    MASKED = True # A rede só escolhe casas vazias (sem partidas perdidas por jogada inválida)
+    BACKEND = None # Ex.: 'auto', para escolher entre serial, lote, threads e processos por calibração
+    STEADY_STATE = False # Avaliação assíncrona em processos, sem barreira de geração
+    ISLANDS = None # Ex.: os.cpu_count(), para evoluir uma subpopulação por núcleo
+    BATCHED = True # Simulador vetorizado (sem processos)
+    CHECKPOINT = 'output/checkpoint.npz'
+    RESUME_FROM = None # Ex.: CHECKPOINT, para continuar um treinamento interrompido
 
-    model = MultilayerPerceptron(TOPOLOGY)
+    model = MultilayerPerceptron(TOPOLOGY, masked=MASKED, dtype=DTYPE)
     minimax = Minimax()
 
     # Treina o modelo
@@ -49,8 +123,20 @@ if __name__ == '__main__':
         max_iter=70,
         learning_rate=0.15,
         mutation_rate=0.5,
-        threshold= 10 * 200, # PipelineLength * MaxEvaluation
+        threshold=None, # Calculado a partir do pipeline (FitnessEvaluator.achievable_score)
         verbose=VERBOSE,
+        batched=BATCHED,
+        checkpoint_path=CHECKPOINT,
+        resume_from=RESUME_FROM,
+        on_generation=print_generation,
+        patience=10,
+        min_diversity=1e-3,
+        screening_pipeline=SCREENING_PIPELINE,
+        screening_keep=0.3,
+        early_abort=not BATCHED,
+        islands=ISLANDS,
+        steady_state=STEADY_STATE,
+        backend=BACKEND, # Só tem efeito na avaliação serial ou em processos
     )
 
     # Salva o modelo
@@ -58,5 +144,6 @@ if __name__ == '__main__':
         json.dump(model.to_json(), f)
 
     # Testa o modelo após o treinamento
+    model.compile() # Pesos finais: jogadas pré-calculadas para todos os tabuleiros
     print("Main : Avaliação contra o Minimax:")
     FitnessEvaluator.test_model(model, minimax, rounds=50)
@@ -1,5 +1,7 @@
 from .model_interface import IModel
 from .multilayer_perceptron import MultilayerPerceptron
 from .minimax import Minimax
+from .batched_perceptron import BatchedMultilayerPerceptron
+from .policy_table import PolicyTable
 
-__all__ = ["IModel, MultilayerPerceptron, Minimax"]
\ No newline at end of file
+__all__ = ["IModel, MultilayerPerceptron, Minimax, BatchedMultilayerPerceptron, PolicyTable"]
\ No newline at end of file
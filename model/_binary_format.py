@@ -0,0 +1,103 @@
+import os
+import struct
+import numpy as np
+
+# Formato binário de modelos (versão 1), little-endian:
+#   magic     6s   b'TTTMLP'
+#   version   H    versão do formato
+#   dtype     c    b'f' (float32) ou b'd' (float64)
+#   (pad)     x
+#   n_sizes   I    número de camadas da topologia
+#   topology  I * n_sizes
+#   (pad)     até DATA_ALIGNMENT bytes
+#   weights   vetor linear de pesos, no layout do cromossomo do AG
+#
+# Tabela de política (versão 1), little-endian:
+#   magic     6s   b'TTTPOL'
+#   version   H    versão do formato
+#   n_codes   I    número de códigos de tabuleiro (3^9)
+#   (pad)     até DATA_ALIGNMENT bytes
+#   moves     uint8 * n_codes, jogada de cada código base 3
+MAGIC = b'TTTMLP'
+POLICY_MAGIC = b'TTTPOL'
+VERSION = 1
+DATA_ALIGNMENT = 64
+_HEADER = struct.Struct('<6sHcxI')
+_POLICY_HEADER = struct.Struct('<6sHI')
+_DTYPES = {b'f': np.dtype('<f4'), b'd': np.dtype('<f8')}
+_CODES = {dtype: code for code, dtype in _DTYPES.items()}
+
+
+def _data_offset(n_sizes: int) -> int:
+    size = _HEADER.size + 4 * n_sizes
+    return -(-size // DATA_ALIGNMENT) * DATA_ALIGNMENT
+
+
+def save_weights(path: str, topology: list[int], weights: np.ndarray, dtype=None) -> None:
+    """
+    Grava topologia e pesos no formato binário. A escrita é atômica (arquivo temporário + rename).
+    """
+    dtype = np.dtype(dtype or weights.dtype).newbyteorder('<')
+    if dtype not in _CODES:
+        raise ValueError(f"Formato binário : dtype não suportado: {dtype}")
+
+    header = _HEADER.pack(MAGIC, VERSION, _CODES[dtype], len(topology)) + struct.pack(f'<{len(topology)}I', *topology)
+    header += b'\0' * (_data_offset(len(topology)) - len(header))
+
+    tmp_path = f'{path}.tmp'
+    with open(tmp_path, 'wb') as f:
+        f.write(header)
+        f.write(np.ascontiguousarray(weights, dtype=dtype).tobytes())
+    os.replace(tmp_path, path)
+
+
+def load_weights(path: str, mmap: bool = True) -> tuple[list[int], np.ndarray]:
+    """
+    Lê topologia e pesos. Com mmap=True, os pesos são um np.memmap somente leitura (sem cópia).
+    """
+    with open(path, 'rb') as f:
+        magic, version, code, n_sizes = _HEADER.unpack(f.read(_HEADER.size))
+        if magic != MAGIC:
+            raise ValueError(f"Formato binário : {path} não é um modelo ({magic!r})")
+        if version != VERSION:
+            raise ValueError(f"Formato binário : versão {version} não suportada (esperado {VERSION})")
+        topology = list(struct.unpack(f'<{n_sizes}I', f.read(4 * n_sizes)))
+
+    dtype = _DTYPES[code]
+    n_weights = sum(n_outputs * (n_inputs + 1) for n_inputs, n_outputs in zip(topology[:-1], topology[1:]))
+    offset = _data_offset(n_sizes)
+    if mmap:
+        weights = np.memmap(path, dtype=dtype, mode='r', offset=offset, shape=(n_weights,))
+    else:
+        weights = np.fromfile(path, dtype=dtype, count=n_weights, offset=offset)
+    return topology, weights
+
+
+def save_policy(path: str, moves: np.ndarray) -> None:
+    """
+    Grava uma tabela de política (uint8 por código de tabuleiro). A escrita é atômica.
+    """
+    header = _POLICY_HEADER.pack(POLICY_MAGIC, VERSION, len(moves))
+    header += b'\0' * (DATA_ALIGNMENT - len(header))
+
+    tmp_path = f'{path}.tmp'
+    with open(tmp_path, 'wb') as f:
+        f.write(header)
+        f.write(np.ascontiguousarray(moves, dtype=np.uint8).tobytes())
+    os.replace(tmp_path, path)
+
+
+def load_policy(path: str, mmap: bool = True) -> np.ndarray:
+    """
+    Lê uma tabela de política. Com mmap=True, retorna um np.memmap somente leitura (sem cópia).
+    """
+    with open(path, 'rb') as f:
+        magic, version, n_codes = _POLICY_HEADER.unpack(f.read(_POLICY_HEADER.size))
+    if magic != POLICY_MAGIC:
+        raise ValueError(f"Formato binário : {path} não é uma tabela de política ({magic!r})")
+    if version != VERSION:
+        raise ValueError(f"Formato binário : versão {version} não suportada (esperado {VERSION})")
+
+    if mmap:
+        return np.memmap(path, dtype=np.uint8, mode='r', offset=DATA_ALIGNMENT, shape=(n_codes,))
+    return np.fromfile(path, dtype=np.uint8, count=n_codes, offset=DATA_ALIGNMENT)
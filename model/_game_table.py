@@ -0,0 +1,143 @@
+import numpy as np
+
+# Codificação base 3 do tabuleiro: vazio -> 0, X (1) -> 1, O (-1) -> 2.
+N_CELLS = 9
+N_CODES = 3 ** N_CELLS
+_POW3 = tuple(3 ** i for i in range(N_CELLS))
+_DIGIT = {0: 0, 1: 1, -1: 2}
+
+WIN_LINES = (
+    (0, 1, 2), (3, 4, 5), (6, 7, 8),
+    (0, 3, 6), (1, 4, 7), (2, 5, 8),
+    (0, 4, 8), (2, 4, 6)
+)
+
+
+def encode(board) -> int:
+    """
+    Converte um tabuleiro (lista 1x9 com 1, -1 e 0) no seu código base 3.
+    """
+    return sum(_DIGIT[int(v)] * p for v, p in zip(board, _POW3))
+
+
+def encode_batch(boards: np.ndarray) -> np.ndarray:
+    """
+    Versão vetorizada de encode para um lote de tabuleiros (n, 9).
+    """
+    return (np.asarray(boards, dtype=np.int64) % 3) @ np.array(_POW3, dtype=np.int64)
+
+
+def decode_batch(codes: np.ndarray) -> np.ndarray:
+    """
+    Inverso de encode_batch: converte códigos base 3 em tabuleiros (n, 9) de int8 com 1, -1 e 0.
+    """
+    digits = (np.asarray(codes, dtype=np.int64)[:, None] // np.array(_POW3, dtype=np.int64)) % 3
+    return np.where(digits == 2, -1, digits).astype(np.int8)
+
+
+def winner(board) -> int | None:
+    """
+    Retorna 1 (X venceu), -1 (O venceu), 0 (empate) ou None (jogo em andamento).
+    """
+    for a, b, c in WIN_LINES:
+        s = board[a] + board[b] + board[c]
+        if s == 3:
+            return 1
+        if s == -3:
+            return -1
+    if 0 not in board:
+        return 0
+    return None
+
+
+class GameTable:
+    """
+    Jogo da velha resolvido: enumera uma única vez todas as posições alcançáveis
+    a partir do tabuleiro vazio (X sempre começa) e guarda, para cada uma:
+
+    - o valor minimax da posição (+1 X vence, 0 empate, -1 O vence);
+    - as melhores jogadas do jogador da vez, como máscara de 9 bits.
+
+    As tabelas são vetores indexados pelo código base 3 do tabuleiro, então a
+    consulta é O(1) depois da construção.
+
+    Atributos:
+    ----------
+    values : np.ndarray[int8]
+        Valor minimax de cada posição (0 para posições não alcançáveis).
+    best_moves : np.ndarray[uint16]
+        Máscara das melhores jogadas do jogador da vez (0 para posições finais ou não alcançáveis).
+    reachable : np.ndarray[bool]
+        Indica se o código corresponde a uma posição alcançável.
+    first_best_move : np.ndarray[int8]
+        Menor índice entre as melhores jogadas (-1 quando não há jogada), para consultas vetorizadas.
+    """
+
+    def __init__(self):
+        self.values = np.zeros(N_CODES, dtype=np.int8)
+        self.best_moves = np.zeros(N_CODES, dtype=np.uint16)
+        self.reachable = np.zeros(N_CODES, dtype=bool)
+        self._solve([0] * N_CELLS, 0, player=1)
+
+        self.first_best_move = np.full(N_CODES, -1, dtype=np.int8)
+        for i in reversed(range(N_CELLS)):
+            self.first_best_move[(self.best_moves >> i) & 1 == 1] = i
+
+    def __len__(self) -> int:
+        return int(self.reachable.sum())
+
+    def _solve(self, board: list[int], code: int, player: int) -> int:
+        if self.reachable[code]:
+            return int(self.values[code])
+        self.reachable[code] = True
+
+        result = winner(board)
+        if result is not None:
+            self.values[code] = result
+            return result
+
+        child_values = {}
+        for i in range(N_CELLS):
+            if board[i] == 0:
+                board[i] = player
+                child_values[i] = self._solve(board, code + _DIGIT[player] * _POW3[i], -player)
+                board[i] = 0
+
+        best = max(child_values.values()) if player == 1 else min(child_values.values())
+        mask = 0
+        for i, value in child_values.items():
+            if value == best:
+                mask |= 1 << i
+
+        self.values[code] = best
+        self.best_moves[code] = mask
+        return best
+
+    def value(self, board) -> int | None:
+        """
+        Valor minimax da posição, ou None se ela não for alcançável.
+        """
+        code = encode(board)
+        return int(self.values[code]) if self.reachable[code] else None
+
+    def best_move(self, board) -> int | None:
+        """
+        Menor índice entre as melhores jogadas do jogador da vez, ou None se não houver.
+        """
+        mask = int(self.best_moves[encode(board)])
+        if not mask:
+            return None
+        return (mask & -mask).bit_length() - 1
+
+
+_TABLE = None
+
+
+def get_game_table() -> GameTable:
+    """
+    Retorna a tabela resolvida, construindo-a na primeira chamada (uma vez por processo).
+    """
+    global _TABLE
+    if _TABLE is None:
+        _TABLE = GameTable()
+    return _TABLE
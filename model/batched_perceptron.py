@@ -0,0 +1,110 @@
+from .model_interface import IModel
+from .multilayer_perceptron import MultilayerPerceptron, _split_layers, _mask_illegal, _mask_stats
+import numpy as np
+
+
+class BatchedMultilayerPerceptron(IModel):
+    """
+    População inteira de MLPs com a mesma topologia, avaliada de uma só vez.
+
+    Os pesos ficam num tensor (pop, n_weights) com o mesmo layout linear do
+    MultilayerPerceptron (e do cromossomo do AG), e cada camada é uma visão
+    (pop, out, in) dele mais um bias (pop, out). A propagação de todos os
+    indivíduos é uma única multiplicação de matrizes em lote e uma tanh por camada.
+
+    Parâmetros:
+    -----------
+    topology : list
+        Lista de inteiros definindo a quantidade de neurônios em cada camada.
+    pop_size : int
+        Número de indivíduos (redes) no lote.
+    masked : bool, default=False
+        Se True, cada rede só escolhe casas vazias do seu tabuleiro (ver MultilayerPerceptron).
+    dtype : default=np.float64
+        Tipo dos pesos; update() converte a população para ele (sem cópia quando já coincide).
+
+    Métodos:
+    --------
+    update(population: np.ndarray) -> None
+        Aplica uma matriz (pop, n_weights) de pesos, uma linha por indivíduo.
+
+    predict(boards: np.ndarray) -> np.ndarray
+        Recebe um tabuleiro por indivíduo (pop, 9), ou vários (pop, n_games, 9),
+        e retorna a jogada escolhida por cada rede.
+
+    mask_stats() -> dict
+        Predições mascaradas e quantas delas a máscara alterou.
+    """
+
+    def __init__(self, topology: list, pop_size: int, masked: bool = False, dtype=np.float64):
+        self._topology = list(topology)
+        self._pop_size = pop_size
+        self._masked = masked
+        self._predictions = 0
+        self._overrides = 0
+        n_weights = MultilayerPerceptron(self._topology).count_weights()
+        self._set_weights(np.zeros((pop_size, n_weights), dtype=dtype))
+
+    @staticmethod
+    def from_model(model: MultilayerPerceptron, pop_size: int) -> 'BatchedMultilayerPerceptron':
+        """
+        Cria um lote com a mesma topologia (e o mesmo modo de máscara e dtype) de uma MLP existente.
+        """
+        return BatchedMultilayerPerceptron(model.get_topology(), pop_size, masked=model.is_masked(), dtype=model.get_dtype())
+
+    def mask_stats(self) -> dict:
+        """
+        Predições feitas com a máscara e quantas delas teriam escolhido uma casa ocupada sem ela.
+        """
+        return _mask_stats(self._predictions, self._overrides)
+
+    def _set_weights(self, population: np.ndarray) -> None:
+        self._weights = population
+        self._layers = _split_layers(population, self._topology)
+
+    def count_weights(self) -> int:
+        """
+        Retorna o número de pesos (incluindo bias) de cada indivíduo.
+        """
+        return self._weights.shape[1]
+
+    def update(self, population: np.ndarray) -> None:
+        """
+        Aplica a população (pop, n_weights). Se já for um np.ndarray do dtype do lote, sem cópia.
+        """
+        population = np.asarray(population, dtype=self._weights.dtype)
+        if population.ndim != 2 or population.shape[1] != self._weights.shape[1]:
+            raise ValueError(f"BatchedMultilayerPerceptron : Esperado (pop, {self._weights.shape[1]}), recebeu {population.shape}")
+        self._pop_size = population.shape[0]
+        self._set_weights(population)
+
+    def _forward(self, boards: np.ndarray) -> np.ndarray:
+        """
+        Propagação para frente de todas as redes. boards tem formato (pop, n_games, 9).
+        """
+        x = boards
+        for weights, bias in self._layers:
+            x = np.tanh(np.matmul(x, weights.transpose(0, 2, 1)) + bias[:, None, :])
+        return x
+
+    def predict(self, boards, active: np.ndarray | None = None) -> np.ndarray:
+        """
+        Retorna a jogada (índice de maior ativação) de cada indivíduo.
+
+        boards com formato (pop, 9) retorna (pop,); com formato (pop, n_games, 9) retorna (pop, n_games).
+        active, com o formato das jogadas retornadas, restringe as estatísticas da máscara às partidas
+        em andamento (as demais são calculadas, mas não contadas).
+        """
+        boards = np.asarray(boards, dtype=self._weights.dtype)
+        single = boards.ndim == 2
+        if single:
+            boards = boards[:, None, :]
+        output = self._forward(boards)
+        moves = np.argmax(output, axis=-1)
+        if self._masked:
+            unmasked = moves
+            moves = np.argmax(_mask_illegal(output, boards), axis=-1)
+            counted = np.ones(moves.shape, dtype=bool) if active is None else np.asarray(active).reshape(moves.shape)
+            self._predictions += int(counted.sum())
+            self._overrides += int((counted & (moves != unmasked)).sum())
+        return moves[:, 0] if single else moves
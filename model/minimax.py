@@ -1,13 +1,105 @@
 import random
+import numpy as np
+from collections import OrderedDict
 from .model_interface import IModel
+from ._game_table import get_game_table, encode, encode_batch, winner
+
+# As 8 simetrias do tabuleiro 3x3 (rotações e reflexões) como permutações de índices.
+_ROTATE = (6, 3, 0, 7, 4, 1, 8, 5, 2)
+_MIRROR = (2, 1, 0, 5, 4, 3, 8, 7, 6)
+
+
+def _symmetries() -> tuple[tuple[int, ...], ...]:
+    perms = []
+    perm = tuple(range(9))
+    for _ in range(4):
+        perms.append(perm)
+        perms.append(tuple(perm[i] for i in _MIRROR))
+        perm = tuple(perm[i] for i in _ROTATE)
+    return tuple(perms)
+
+
+SYMMETRIES = _symmetries()
+
+EXACT, LOWER, UPPER = 0, 1, 2
+
+
+class TranspositionTable:
+    """
+    Cache de valores do Minimax com chave canônica (as 8 simetrias do tabuleiro
+    são dobradas na mesma entrada) e tamanho limitado com despejo LRU.
+
+    Cada entrada guarda o valor e o tipo de limite (EXACT, LOWER ou UPPER),
+    necessário porque valores obtidos com poda alfa-beta podem ser apenas limites.
+
+    Atributos:
+    ----------
+    hits : int
+        Consultas que encontraram uma entrada.
+    misses : int
+        Consultas sem entrada.
+    """
+
+    def __init__(self, max_size: int = 8192):
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @staticmethod
+    def key(board: list, maximizing: bool) -> int:
+        canonical = min(encode([board[i] for i in perm]) for perm in SYMMETRIES)
+        return 2 * canonical + int(maximizing)
+
+    def get(self, key: int) -> tuple[int, int] | None:
+        entry = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        self._entries.move_to_end(key)
+        return entry
+
+    def put(self, key: int, value: int, flag: int) -> None:
+        self._entries[key] = (value, flag)
+        self._entries.move_to_end(key)
+        if len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self.hits = 0
+        self.misses = 0
+
+    def stats(self) -> dict:
+        total = self.hits + self.misses
+        return {
+            "size": len(self._entries),
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / total if total else 0.0,
+        }
 
 
 class Minimax(IModel):
     """
     Jogador automático usando Minimax com dificuldade ajustável e otimização via poda alfa-beta.
+
+    Por padrão as jogadas ótimas vêm de uma tabela com o jogo resolvido (todas as 5478
+    posições alcançáveis), construída uma única vez por processo. A busca alfa-beta é usada
+    apenas como fallback para tabuleiros fora da tabela ou quando solved=False.
+
+    A busca usa uma tabela de transposição (self.transpositions) que sobrevive entre
+    chamadas de predict e trocas de modo, já que o valor de um tabuleiro não depende
+    da dificuldade.
     """
 
-    def __init__(self):
+    def __init__(self, solved: bool = True, cache_size: int = 8192):
+        self._table = get_game_table() if solved else None
+        self.transpositions = TranspositionTable(cache_size)
         self.mode = 'medium'
         self.update('medium')
 
@@ -25,6 +117,9 @@ class Minimax(IModel):
             raise ValueError(f"Minimax : Modo inválido: {mode}. Use 'easy', 'medium' ou 'hard'.")
         self.mode = mode
 
+    def is_deterministic(self) -> bool:
+        return self.randomness == 0.0
+
     def predict(self, board: list) -> int:
         """
         Escolhe uma jogada no tabuleiro (índice de 0 a 8).
@@ -38,6 +133,12 @@ class Minimax(IModel):
         if random.random() < self.randomness:
             return random.choice(empty_indices)
 
+        # Consulta O(1) na tabela resolvida quando é a vez de O numa posição alcançável
+        if self._table is not None and board.count(1) == board.count(-1) + 1:
+            best_move = self._table.best_move(board)
+            if best_move is not None:
+                return best_move
+
         # Executa Minimax com poda alfa-beta
         best_score = float('inf')
         best_move = None
@@ -56,14 +157,91 @@ class Minimax(IModel):
 
         return best_move
 
+    def move_distribution(self, board: list) -> dict[int, float]:
+        """
+        Probabilidade de cada jogada que predict pode escolher no modo atual:
+        randomness distribuída uniformemente entre as casas vazias e o restante na jogada ótima.
+        """
+        empty_indices = [i for i, val in enumerate(board) if val == 0]
+
+        if not empty_indices:
+            raise ValueError(f"Minimax : [ERROR] No possible moves: {board}")
+
+        distribution = {i: self.randomness / len(empty_indices) for i in empty_indices}
+        if self.randomness < 1.0:
+            randomness = self.randomness
+            self.randomness = 0.0
+            try:
+                best_move = self.predict(board)
+            finally:
+                self.randomness = randomness
+            distribution[best_move] += 1.0 - randomness
+        return distribution
+
+    def predict_batch(self, boards: np.ndarray, randomness: np.ndarray | None = None) -> np.ndarray:
+        """
+        Escolhe uma jogada de O para cada tabuleiro de um lote (n, 9) com uma única consulta vetorizada.
+
+        Parâmetros:
+        -----------
+        boards : np.ndarray
+            Tabuleiros (n, 9) em andamento, todos com O da vez.
+        randomness : np.ndarray, opcional
+            Probabilidade de jogada aleatória por tabuleiro. Por padrão, usa a do modo atual.
+        """
+        boards = np.asarray(boards)
+        if randomness is None:
+            randomness = np.full(len(boards), self.randomness)
+
+        table = self._table if self._table is not None else get_game_table()
+        moves = table.first_best_move[encode_batch(boards)].astype(np.intp)
+
+        # Tabuleiros fora da tabela caem na busca alfa-beta
+        for i in np.flatnonzero(moves < 0):
+            moves[i] = self.predict(boards[i].tolist())
+
+        # Jogada aleatória uniforme entre as casas vazias
+        rand = np.random.random(len(boards)) < randomness
+        if rand.any():
+            keys = np.random.random((int(rand.sum()), boards.shape[1]))
+            keys[boards[rand] != 0] = -1
+            moves[rand] = np.argmax(keys, axis=1)
+        return moves
+
     def minimax(self, board, maximizing: bool, alpha: float, beta: float) -> int:
         """
-        Algoritmo Minimax com poda alfa-beta.
+        Algoritmo Minimax com poda alfa-beta e tabela de transposição.
         """
         winner = self.check_winner(board)
         if winner is not None:
             return winner
 
+        key = TranspositionTable.key(board, maximizing)
+        entry = self.transpositions.get(key)
+        if entry is not None:
+            value, flag = entry
+            if flag == EXACT:
+                return value
+            if flag == LOWER:
+                alpha = max(alpha, value)
+            else:
+                beta = min(beta, value)
+            if beta <= alpha:
+                return value
+
+        alpha_orig, beta_orig = alpha, beta
+        value = self._search(board, maximizing, alpha, beta)
+
+        if value <= alpha_orig:
+            flag = UPPER
+        elif value >= beta_orig:
+            flag = LOWER
+        else:
+            flag = EXACT
+        self.transpositions.put(key, value, flag)
+        return value
+
+    def _search(self, board, maximizing: bool, alpha: float, beta: float) -> int:
         if maximizing:
             max_eval = float('-inf')
             for i in range(9):
@@ -90,20 +268,4 @@ class Minimax(IModel):
             return min_eval
 
     def check_winner(self, board: list):
-        wins = [
-            [0, 1, 2], [3, 4, 5], [6, 7, 8],
-            [0, 3, 6], [1, 4, 7], [2, 5, 8],
-            [0, 4, 8], [2, 4, 6]
-        ]
-        for combo in wins:
-            values = [board[i] for i in combo]
-            if values == [1, 1, 1]:
-                return 1
-            elif values == [-1, -1, -1]:
-                return -1
-
-        if 0 not in board:
-            return 0  # Empate
-
-        return None  # Jogo em andamento
-
+        return winner(board)
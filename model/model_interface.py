@@ -6,4 +6,10 @@ class IModel(ABC):
         pass
 
     def update(self, var) -> None:
-        pass
\ No newline at end of file
+        pass
+
+    def is_deterministic(self) -> bool:
+        """
+        Indica se predict sempre retorna a mesma jogada para o mesmo tabuleiro.
+        """
+        return False
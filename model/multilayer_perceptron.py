@@ -1,6 +1,44 @@
+import json
+from collections import OrderedDict
 from .model_interface import IModel
-from ._neuron import Neuron
+from ._binary_format import save_weights, load_weights
+from ._game_table import N_CODES, encode, decode_batch
 import numpy as np
+
+
+def _split_layers(flat: np.ndarray, topology: list[int]) -> list[tuple[np.ndarray, np.ndarray]]:
+    """
+    Fatia um vetor linear de pesos em (matriz de pesos, vetor de bias) por camada, sem cópia.
+
+    O layout é o mesmo do cromossomo do AG: para cada camada, cada neurônio contribui
+    com seus n_inputs pesos seguidos do bias. Aceita dimensões extras à esquerda
+    (ex.: (pop, n_weights) gera matrizes (pop, out, in)).
+    """
+    layers = []
+    idx = 0
+    for n_inputs, n_outputs in zip(topology[:-1], topology[1:]):
+        size = n_outputs * (n_inputs + 1)
+        block = flat[..., idx:idx + size].reshape(flat.shape[:-1] + (n_outputs, n_inputs + 1))
+        layers.append((block[..., :-1], block[..., -1]))
+        idx += size
+    return layers
+
+
+def _mask_illegal(output: np.ndarray, boards: np.ndarray) -> np.ndarray:
+    """
+    Anula (-inf) as ativações das casas ocupadas, de modo que softmax/argmax só considerem jogadas legais.
+    """
+    return np.where(boards != 0, -np.inf, output)
+
+
+def _mask_stats(predictions: int, overrides: int) -> dict:
+    return {
+        "predictions": predictions,
+        "overrides": overrides,
+        "override_rate": overrides / predictions if predictions else 0.0,
+    }
+
+
 class MultilayerPerceptron(IModel):
     """
     Rede Neural Perceptron Multicamadas (MLP) para problemas de aprendizado supervisionado.
@@ -9,35 +47,67 @@ class MultilayerPerceptron(IModel):
     - Criar uma MLP com uma topologia arbitrária.
     - Usar o Algoritmo Genético (AG) para otimizar os pesos da rede.
     - Prever saídas a partir de entradas.
-    - Serializar e carregar o modelo via JSON.
+    - Serializar e carregar o modelo via JSON ou formato binário (carregado via memmap).
+
+    Os pesos ficam num único vetor contíguo (mesmo layout do cromossomo do AG) e cada
+    camada é uma visão dele como matriz (out, in) mais um vetor de bias, de modo que a
+    propagação é uma multiplicação de matriz e uma tanh por camada.
 
     Parâmetros:
     -----------
     topology : list
         Lista de inteiros definindo a quantidade de neurônios em cada camada da MLP.
         Exemplo: [9, 9, 9] cria uma rede com 9 neurônios de entrada, 9 na camada oculta, 9 na saída.
-    population_size : int, default=100
-        Tamanho da população usada no AG para treinar os pesos (não utilizado diretamente na MLP, mas armazenado para referência).
+    masked : bool, default=False
+        Se True, as casas ocupadas do tabuleiro são mascaradas antes da softmax/argmax, então a rede
+        nunca escolhe uma jogada inválida. mask_stats() informa quantas decisões a máscara alterou.
+    cache_size : int, default=0
+        Tamanho do cache LRU tabuleiro (código base 3) -> jogada. 0 desativa. O cache é descartado a cada
+        update() e set_masked(); as predições servidas por ele não entram em mask_stats().
+    dtype : default=np.float64
+        Tipo dos pesos. Com np.float32 a rede ocupa metade da memória e propaga em precisão simples;
+        update() converte os pesos recebidos para este tipo (sem cópia quando já coincidem).
 
     Métodos:
     --------
     count_weights() -> int
         Retorna o número total de pesos (incluindo bias) necessários para a rede.
 
-    get_layers() -> list
-        Retorna as camadas ocultas e de saída da MLP (ignora a camada de entrada).
+    get_topology() -> list[int]
+        Retorna a topologia da MLP (neurônios por camada, incluindo a entrada).
+
+    get_dtype() -> np.dtype
+        Retorna o tipo dos pesos.
 
     predict(board: list) -> int
         Realiza a propagação para frente na MLP e retorna a posição de maior ativação (índice do maior valor).
 
+    compile() -> np.ndarray
+        Pré-calcula a jogada para todos os 3^9 tabuleiros; predict passa a ser uma consulta de tabela.
+
+    predict_batch(boards: np.ndarray) -> np.ndarray
+        Jogada de cada tabuleiro de um lote (n, 9), numa única propagação.
+
+    cache_stats() -> dict
+        Tamanho, acertos, falhas e taxa de acerto do cache de jogadas.
+
+    mask_stats() -> dict
+        Número de predições mascaradas e quantas delas a máscara alterou (overrides, override_rate).
+
     to_json() -> dict
         Serializa a estrutura e pesos da rede em um dicionário JSON.
 
-    load_weights_from_vector(weights_vector: list)
-        Aplica um vetor linear de pesos em toda a rede.
+    update(weights_vector: list)
+        Aplica um vetor linear de pesos (cromossomo do AG) em toda a rede.
 
     from_json(json: dict) -> MultilayerPerceptron
         Cria uma instância da MLP a partir de um dicionário JSON.
+
+    to_binary(path: str, dtype=None)
+        Grava a topologia e um único bloco contíguo de pesos em formato binário versionado.
+
+    from_binary(path: str, mmap: bool = True) -> MultilayerPerceptron
+        Carrega um modelo binário; com mmap=True as camadas são visões diretas do arquivo.
     """
 
     '''
@@ -46,32 +116,121 @@ class MultilayerPerceptron(IModel):
     -   Corrigir a matriz de neurônios para não necessitar ser quadrada
     -
     '''
-    def __init__(self, topology: list):
+    def __init__(self, topology: list, masked: bool = False, cache_size: int = 0, dtype=np.float64):
         """
-        # Setta neurônio da primeira layer pra frente, pois a primeira layer deve ser o tabuleiro
         Inicializa a MLP com a topologia especificada.
 
-        Cada neurônio em cada camada (exceto a de entrada) é instanciado com a quantidade de entradas definida pela topologia.
+        Os pesos (incluindo bias) começam zerados, como nos neurônios originais.
         """
-        self._topology = topology
+        self._topology = list(topology)
+        self._moves = OrderedDict()
+        self._compiled = None
+        self.set_cache_size(cache_size)
         self.set_verbose(False)
+        self.set_masked(masked)
 
-        self._neurons = []
-
-        for i in range(1, len(topology)):
-            n_inputs = topology[i - 1] # Número de neurônios da camada anterior
-            n_outputs = topology[i]     # Número de neurônios da camada atual
-            layer = [Neuron(n_params=n_inputs) for _ in range(n_outputs)]
-            self._neurons.append(layer)
+        n_weights = sum(n_outputs * (n_inputs + 1) for n_inputs, n_outputs in zip(topology[:-1], topology[1:]))
+        self._set_weights(np.zeros(n_weights, dtype=dtype))
 
     def set_verbose(self, verbose:bool) -> None:
         self._verbose = verbose
 
+    def set_masked(self, masked: bool) -> None:
+        """
+        Liga/desliga a inferência mascarada (só jogadas em casas vazias) e zera as estatísticas da máscara.
+        """
+        self._masked = masked
+        self._predictions = 0
+        self._overrides = 0
+        self.clear_cache()
+
+    def is_masked(self) -> bool:
+        return self._masked
+
+    def mask_stats(self) -> dict:
+        """
+        Predições feitas com a máscara e quantas delas teriam escolhido uma casa ocupada sem ela.
+        """
+        return _mask_stats(self._predictions, self._overrides)
+
+    def set_cache_size(self, cache_size: int) -> None:
+        """
+        Define o tamanho do cache LRU de jogadas (0 desativa) e zera o cache.
+        """
+        self._cache_size = cache_size
+        self.clear_cache()
+
+    def clear_cache(self) -> None:
+        """
+        Descarta o cache de jogadas, a tabela compilada e as estatísticas do cache.
+        """
+        self._moves.clear()
+        self._compiled = None
+        self._hits = 0
+        self._misses = 0
+
+    def cache_stats(self) -> dict:
+        total = self._hits + self._misses
+        return {
+            "size": len(self._moves),
+            "hits": self._hits,
+            "misses": self._misses,
+            "hit_rate": self._hits / total if total else 0.0,
+            "compiled": self._compiled is not None,
+        }
+
+    def compile(self) -> np.ndarray:
+        """
+        Compila o modelo atual numa tabela com a jogada de cada um dos 3^9 tabuleiros (indexada pelo
+        código base 3), calculada numa única propagação em lote. Até o próximo update(), predict é uma
+        consulta O(1) a essa tabela.
+
+        Retorna:
+        --------
+        np.ndarray[int8] : jogada de cada código de tabuleiro.
+        """
+        moves = self.predict_batch(decode_batch(np.arange(N_CODES))).astype(np.int8)
+        self.clear_cache()
+        self._compiled = moves
+        return self._compiled
+
+    def predict_batch(self, boards: np.ndarray) -> np.ndarray:
+        """
+        Jogada de cada tabuleiro de um lote (n, 9) numa única propagação (respeitando a máscara, se ativa).
+
+        Não usa o cache de jogadas nem conta em mask_stats().
+        """
+        inputs = np.asarray(boards, dtype=self._weights.dtype)
+        output = self._forward(inputs)
+        if self._masked:
+            output = _mask_illegal(output, inputs)
+        return np.argmax(output, axis=-1)
+
+    def _set_weights(self, flat: np.ndarray) -> None:
+        self._weights = flat
+        self._layers = _split_layers(flat, self._topology)
+        self.clear_cache()
+
+    def get_topology(self) -> list[int]:
+        return list(self._topology)
+
+    def get_dtype(self) -> np.dtype:
+        return self._weights.dtype
+
     def count_weights(self) -> int:
         """
         Retorna o número total de pesos (incluindo bias) necessários para a rede.
         """
-        return sum((neuron.n + 1) for layer in self._neurons for neuron in layer)
+        return self._weights.size
+
+    def _forward(self, inputs: np.ndarray) -> np.ndarray:
+        """
+        Propagação para frente. Aceita um tabuleiro (9,) ou um lote (n, 9).
+        """
+        x = inputs
+        for weights, bias in self._layers:
+            x = np.tanh(x @ weights.T + bias)
+        return x
 
     def predict(self, board: list[int]) -> int:
         """
@@ -81,13 +240,40 @@ class MultilayerPerceptron(IModel):
         --------
         int : índice da saída com maior ativação (posição de maior valor no vetor final da rede).
         """
-        input = board
-        for layer in self._neurons:
-            input = [neuron.decide(input) for neuron in layer]
-        output = self._softmax(input)
+        if self._verbose or (self._compiled is None and not self._cache_size):
+            return self._predict(board)
+        code = encode(board)
+        if self._compiled is not None:
+            return int(self._compiled[code])
+
+        move = self._moves.get(code)
+        if move is not None:
+            self._hits += 1
+            self._moves.move_to_end(code)
+            return move
+        self._misses += 1
+        move = self._predict(board)
+        self._moves[code] = move
+        if len(self._moves) > self._cache_size:
+            self._moves.popitem(last=False)
+        return move
+
+    def _predict(self, board: list[int]) -> int:
+        inputs = np.asarray(board, dtype=self._weights.dtype)
+        output = self._forward(inputs)
+        if self._masked:
+            unmasked = int(np.argmax(output))
+            output = _mask_illegal(output, inputs)
+            move = int(np.argmax(output))
+            self._predictions += 1
+            self._overrides += move != unmasked
         if self._verbose:
-            print(f'\nMultilayerPerceptron : {output}')
-        return int(np.argmax(output))  # Retorna o índice do maior valor como decisão final.
+            print(f'\nMultilayerPerceptron : {self._softmax(output)}')
+        # A softmax é monotônica, então o argmax das ativações é a mesma decisão final.
+        return move if self._masked else int(np.argmax(output))
+
+    def is_deterministic(self) -> bool:
+        return True
 
     def _softmax(self, x):
         # sso faz com que a rede normalize os outputs da camada final em probabilidades bem distribuídas,
@@ -100,23 +286,25 @@ class MultilayerPerceptron(IModel):
         Aplica um vetor linear de pesos em toda a rede.
 
         O vetor de pesos deve conter todos os pesos e bias da rede concatenados em uma única lista.
+        Se já for um np.ndarray do dtype da rede, as camadas passam a ser visões dele (sem cópia).
         """
-        idx = 0
-        for layer in self._neurons:
-            for neuron in layer:
-                n_params = neuron.n + 1
-                neuron.adjust_weights(weights_vector[idx:idx + n_params])
-                idx += n_params
+        flat = np.asarray(weights_vector, dtype=self._weights.dtype)
+        if flat.shape != self._weights.shape:
+            raise ValueError(f"MultilayerPerceptron : Esperado {self._weights.size} pesos, recebeu {flat.size}")
+        self._set_weights(flat)
 
     def to_json(self) -> dict:
         """
         Serializa a estrutura e os pesos da rede em um dicionário JSON.
         """
         all_neurons = []
-        for layer in self._neurons:
+        for weights, bias in self._layers:
             layer_neurons = []
-            for neuron in layer:
-                layer_neurons.append(neuron.to_json())
+            for neuron_weights, neuron_bias in zip(weights, bias):
+                layer_neurons.append({
+                    "n_params": int(weights.shape[1]),
+                    "weights": neuron_weights.tolist() + [float(neuron_bias)]
+                })
             all_neurons.append(layer_neurons)
 
         return {
@@ -125,7 +313,7 @@ class MultilayerPerceptron(IModel):
         }
 
     @staticmethod
-    def from_json(json: dict) -> 'MultilayerPerceptron':
+    def from_json(json: dict, dtype=np.float64) -> 'MultilayerPerceptron':
         """
         Cria uma nova instância da MLP a partir de um dicionário JSON.
 
@@ -133,12 +321,44 @@ class MultilayerPerceptron(IModel):
         -----------
         json : dict
             Dicionário no formato exportado pelo método to_json().
+        dtype : default=np.float64
+            Tipo dos pesos da rede criada.
+        """
+        mlp = MultilayerPerceptron(list(json['topology']), dtype=dtype)
+        flat = [w for layer_json in json['neurons'] for neuron_json in layer_json for w in neuron_json['weights']]
+        mlp.update(flat)
+        return mlp
+
+    def to_binary(self, path: str, dtype=None) -> None:
+        """
+        Grava o modelo no formato binário (cabeçalho com a topologia + bloco de pesos float32/float64).
+
+        Parâmetros:
+        -----------
+        path : str
+            Caminho do arquivo de saída.
+        dtype : opcional
+            np.float32 ou np.float64. Por padrão, o dtype atual dos pesos.
         """
-        mlp = MultilayerPerceptron(list(json['topology']))
-        mlp._neurons = []
-        for layer_json in list[dict](json['neurons']):
-            layer = []
-            for neuron_json in layer_json:
-                layer.append(Neuron.from_json(neuron_json))
-            mlp._neurons.append(layer)
+        save_weights(path, self._topology, self._weights, dtype)
+
+    @staticmethod
+    def from_binary(path: str, mmap: bool = True) -> 'MultilayerPerceptron':
+        """
+        Carrega um modelo gravado por to_binary().
+
+        Com mmap=True, os pesos são mapeados do arquivo sem cópia e as matrizes das camadas são visões dele.
+        A rede usa o dtype gravado no arquivo (float32 ou float64).
+        """
+        topology, weights = load_weights(path, mmap=mmap)
+        mlp = MultilayerPerceptron(topology, dtype=weights.dtype.newbyteorder('='))
+        mlp.update(weights)
         return mlp
+
+    @staticmethod
+    def convert_json_to_binary(json_path: str, binary_path: str, dtype=np.float64) -> None:
+        """
+        Converte um modelo salvo em JSON (output/model_*.json) para o formato binário.
+        """
+        with open(json_path, 'r') as f:
+            MultilayerPerceptron.from_json(json.load(f)).to_binary(binary_path, dtype)
@@ -0,0 +1,90 @@
+import numpy as np
+from .model_interface import IModel
+from ._binary_format import save_policy, load_policy
+from ._game_table import N_CODES, encode, decode_batch, get_game_table
+
+NO_MOVE = 255
+
+
+class PolicyTable(IModel):
+    """
+    Política estática compilada a partir de um modelo treinado: a jogada escolhida em cada
+    posição fica num vetor uint8 indexado pelo código base 3 do tabuleiro, então predict
+    é uma única consulta ao vetor, sem propagação na rede.
+
+    Só as posições alcançáveis e ainda em andamento são calculadas (numa única propagação
+    em lote); as demais guardam NO_MOVE.
+
+    Parâmetros:
+    -----------
+    moves : np.ndarray[uint8]
+        Jogada de cada um dos 3^9 códigos de tabuleiro (NO_MOVE para posições fora da tabela).
+
+    Métodos:
+    --------
+    from_model(model) -> PolicyTable
+        Compila um modelo com predict_batch() (ex.: MultilayerPerceptron).
+
+    verify(model) -> list[int]
+        Compara a tabela com o predict() do modelo e retorna os códigos divergentes.
+
+    save(path) / load(path, mmap=True) -> PolicyTable
+        Grava e carrega a tabela em formato binário (carregada via memmap).
+    """
+
+    def __init__(self, moves: np.ndarray):
+        moves = np.asarray(moves)
+        if moves.shape != (N_CODES,) or moves.dtype != np.uint8:
+            raise ValueError(f"PolicyTable : Esperado uint8 ({N_CODES},), recebeu {moves.dtype} {moves.shape}")
+        self._moves = moves
+
+    def __len__(self) -> int:
+        return int((self._moves != NO_MOVE).sum())
+
+    @staticmethod
+    def positions() -> np.ndarray:
+        """
+        Códigos das posições alcançáveis em andamento (as que recebem uma jogada na tabela).
+        """
+        table = get_game_table()
+        return np.flatnonzero(table.reachable & (table.best_moves != 0))
+
+    @staticmethod
+    def from_model(model: IModel) -> 'PolicyTable':
+        """
+        Calcula a jogada do modelo em todas as posições alcançáveis numa única chamada a predict_batch().
+        """
+        codes = PolicyTable.positions()
+        moves = np.full(N_CODES, NO_MOVE, dtype=np.uint8)
+        moves[codes] = model.predict_batch(decode_batch(codes))
+        return PolicyTable(moves)
+
+    def predict(self, board: list[int]) -> int:
+        move = int(self._moves[encode(board)])
+        if move == NO_MOVE:
+            raise ValueError(f"PolicyTable : Tabuleiro fora da tabela: {list(board)}")
+        return move
+
+    def is_deterministic(self) -> bool:
+        return True
+
+    def verify(self, model: IModel) -> list[int]:
+        """
+        Confere a tabela contra o modelo vivo, jogada a jogada via model.predict().
+
+        Retorna:
+        --------
+        list[int] : códigos de tabuleiro em que a tabela e o modelo divergem (vazia se forem equivalentes).
+        """
+        codes = np.flatnonzero(self._moves != NO_MOVE)
+        return [
+            int(code) for code, board in zip(codes, decode_batch(codes).tolist())
+            if model.predict(board) != self._moves[code]
+        ]
+
+    def save(self, path: str) -> None:
+        save_policy(path, self._moves)
+
+    @staticmethod
+    def load(path: str, mmap: bool = True) -> 'PolicyTable':
+        return PolicyTable(load_policy(path, mmap=mmap))
@@ -1,16 +1,22 @@
 import os
 import json
 from genetic_algorithm import GeneticAlgorithm, FitnessEvaluator
-from model import MultilayerPerceptron, Minimax
+from model import MultilayerPerceptron, Minimax, PolicyTable
 
-def load_model(json_path: str) -> MultilayerPerceptron:
-    with open(json_path, 'r') as f:
+def load_model(path: str) -> MultilayerPerceptron | PolicyTable:
+    if path.endswith('.policy'):
+        return PolicyTable.load(path)
+    if path.endswith('.bin'):
+        return MultilayerPerceptron.from_binary(path)
+    with open(path, 'r') as f:
         data = json.load(f)
     return MultilayerPerceptron.from_json(data)
 
 # Salva o modelo
 
 model = load_model('output/model_3.json')
+if isinstance(model, MultilayerPerceptron):
+    model.compile() # Modelo fixo: jogadas pré-calculadas para todos os tabuleiros
 minimax = Minimax()
 minimax.update('easy')
 
@@ -0,0 +1,19 @@
+import numpy as np
+from concurrent.futures import ThreadPoolExecutor
+
+from genetic_algorithm import FitnessEvaluator
+from genetic_algorithm.backends import create_backend
+from model import MultilayerPerceptron, Minimax
+
+
+def test_thread_executor_matches_serial():
+    evaluator = FitnessEvaluator(MultilayerPerceptron([9, 9]), Minimax(), ['hard'] * 2)
+    population = np.random.default_rng(0).uniform(-1, 1, (400, 90))
+
+    with create_backend('serial', (evaluator,), population.shape) as serial:
+        expected = serial.evaluate(population)
+    with ThreadPoolExecutor(max_workers=4) as executor, \
+            create_backend(executor, (evaluator,), population.shape, chunk_size=1) as backend:
+        # A disputa pelo learner compartilhado é intermitente: repete para torná-la visível
+        for _ in range(5):
+            np.testing.assert_array_equal(backend.evaluate(population), expected)
@@ -0,0 +1,46 @@
+import multiprocessing as mp
+import numpy as np
+import pytest
+
+from genetic_algorithm import FitnessEvaluator, DistributedCoordinator
+from model import MultilayerPerceptron, Minimax
+
+
+@pytest.fixture
+def spawn():
+    start_method = mp.get_start_method(allow_none=True)
+    mp.set_start_method('spawn', force=True)
+    yield
+    mp.set_start_method(start_method, force=True)
+
+
+def make_evaluator():
+    return FitnessEvaluator(MultilayerPerceptron([9, 9]), Minimax(), ['hard'] * 2)
+
+
+def test_coordinator_matches_serial_with_spawn(spawn):
+    evaluator = make_evaluator()
+    population = np.random.default_rng(0).uniform(-1, 1, (16, 90))
+
+    with DistributedCoordinator(evaluator, local_workers=1, chunk_size=4) as coordinator:
+        scores = coordinator.evaluate(population)
+
+    np.testing.assert_array_equal(scores, [evaluator(chromosome) for chromosome in population])
+
+
+def test_evaluate_fails_without_workers():
+    with DistributedCoordinator(make_evaluator(), heartbeat_interval=0.1, worker_timeout=0.3) as coordinator:
+        with pytest.raises(RuntimeError, match="Nenhum trabalhador ativo"):
+            coordinator.evaluate(np.zeros((4, 90)))
+
+
+def test_healthy_workers_are_not_requeued():
+    evaluator = make_evaluator()
+    population = np.random.default_rng(0).uniform(-1, 1, (32, 90))
+    expected = [evaluator(chromosome) for chromosome in population]
+
+    with DistributedCoordinator(evaluator, local_workers=2, chunk_size=1, heartbeat_interval=0.1,
+                                heartbeat_timeout=0.5) as coordinator:
+        for _ in range(3):
+            np.testing.assert_array_equal(coordinator.evaluate(population), expected)
+        assert coordinator.requeued == 0
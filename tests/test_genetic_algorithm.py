@@ -0,0 +1,69 @@
+import random
+import numpy as np
+import pytest
+
+from genetic_algorithm import FitnessEvaluator, GeneticAlgorithm
+from model import MultilayerPerceptron, Minimax
+
+
+def make_evaluator(pipeline, masked=False):
+    return FitnessEvaluator(MultilayerPerceptron([9, 9], masked=masked), Minimax(), pipeline)
+
+
+@pytest.mark.parametrize("masked", [False, True])
+def test_batched_matches_serial_on_deterministic_pipeline(masked):
+    evaluator = make_evaluator(['hard'] * 4, masked=masked)
+    assert evaluator.is_deterministic()
+    population = np.random.default_rng(0).uniform(-1, 1, (32, 90))
+
+    serial = np.array([evaluator(chromosome) for chromosome in population])
+    batched = evaluator.evaluate_population(population)
+
+    np.testing.assert_array_equal(batched, serial)
+
+
+@pytest.mark.parametrize("backend", ['serial', 'batched'])
+def test_resume_matches_uninterrupted_run(tmp_path, backend):
+    pipeline = ['hard'] * 2 + ['medium'] * 2
+    checkpoint = str(tmp_path / "checkpoint.npz")
+
+    def make_ga(max_iter, **options):
+        # O Minimax 'medium' sorteia jogadas com os RNGs globais, gravados no checkpoint
+        random.seed(0)
+        np.random.seed(0)
+        return GeneticAlgorithm(20, 90, make_evaluator(pipeline), max_iter=max_iter, seed=0, backend=backend,
+                                async_checkpoint=False, **options)
+
+    uninterrupted = make_ga(4)
+    expected = uninterrupted.run(threshold=np.inf)
+
+    make_ga(2, checkpoint_path=checkpoint).run(threshold=np.inf)
+    resumed = make_ga(4)
+    result = resumed.run(threshold=np.inf, resume_from=checkpoint)
+
+    np.testing.assert_array_equal(result, expected)
+    np.testing.assert_array_equal(resumed._population, uninterrupted._population)
+    np.testing.assert_array_equal(resumed._fitness_scores, uninterrupted._fitness_scores)
+
+
+def test_lucky_sample_does_not_reach_threshold():
+    evaluator = make_evaluator(['medium'], masked=True)
+    threshold = evaluator.achievable_score()
+    history = []
+    random.seed(0)
+    np.random.seed(0)
+    ga = GeneticAlgorithm(30, 90, evaluator, max_iter=3, seed=0, backend='serial', on_generation=history.append)
+    ga.run(threshold=threshold)
+
+    # Vitórias isoladas superam o limiar, mas nenhum cromossomo tem o valor esperado ótimo
+    assert max(metrics['fitness']['max'] for metrics in history) >= threshold
+    assert ga.stop_reason != 'threshold'
+
+
+def test_threshold_uses_expected_score():
+    evaluator = make_evaluator(['medium'], masked=True)
+    ga = GeneticAlgorithm(30, 90, evaluator, max_iter=3, seed=0, backend='serial')
+    ga.run(threshold=-300)
+
+    assert ga.stop_reason == 'threshold'
+    assert max(evaluator.expected_score(chromosome) for chromosome in ga._elites) >= -300
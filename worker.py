@@ -0,0 +1,16 @@
+import argparse
+from genetic_algorithm.distributed import run_worker
+
+# Trabalhador de avaliação distribuída: conecta-se a um DistributedCoordinator (local ou em outra máquina)
+# e avalia blocos de cromossomos até o coordenador encerrar.
+# Uso: python worker.py HOST:PORTA --authkey CHAVE [--heartbeat 1.0]
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="Trabalhador de avaliação distribuída do GeneticAlgorithm.")
+    parser.add_argument('address', help="Endereço do coordenador, HOST:PORTA.")
+    parser.add_argument('--authkey', required=True, help="Chave de autenticação do coordenador (DistributedCoordinator.authkey).")
+    parser.add_argument('--heartbeat', type=float, default=1.0, help="Intervalo entre heartbeats, em segundos.")
+    args = parser.parse_args()
+
+    host, port = args.address.rsplit(':', 1)
+    run_worker((host, int(port)), args.authkey.encode(), args.heartbeat)